@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import random
 import time
+from collections.abc import Callable
 from typing import Any, TypeVar
 
 from rpctl.config.constants import (
@@ -89,10 +90,17 @@ def _calculate_delay(
     base: float,
     max_delay: float,
     retry_after: float | None = None,
+    *,
+    rng: Callable[[float, float], float] | None = None,
 ) -> float:
-    """Compute delay with exponential backoff, jitter, or Retry-After."""
+    """Compute delay with exponential backoff, jitter, or Retry-After.
+
+    *rng* draws the jitter from ``[a, b]`` and defaults to ``random.uniform``,
+    looked up per call so patching ``random.uniform`` still takes effect;
+    tests pass a deterministic one.
+    """
     if retry_after is not None and retry_after > 0:
         return float(min(retry_after, max_delay))
     delay = base * (2 ** (attempt - 1))
-    jitter = random.uniform(0, delay * 0.5)  # noqa: S311
+    jitter = (rng or random.uniform)(0, delay * 0.5)
     return float(min(delay + jitter, max_delay))
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import typer
+from rich.console import Console
 
 from rpctl.config.settings import Settings
 from rpctl.errors import RpctlError
@@ -14,6 +15,7 @@ if TYPE_CHECKING:
     from rpctl.services.capacity_service import CapacityService
 
 app = typer.Typer(no_args_is_help=True)
+err_console = Console(stderr=True)
 
 
 def _get_capacity_service(ctx: typer.Context) -> CapacityService:
@@ -46,9 +48,7 @@ def list_gpus(
         fmt = ctx.obj.get("output_format", "table") if ctx.obj else "table"
         output(gpu_types, output_format=fmt, table_type="gpu_list")
     except RpctlError as e:
-        from rich.console import Console
-
-        Console(stderr=True).print(f"[red]Error:[/red] {e}")
+        err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
 
 
@@ -70,9 +70,7 @@ def check(
         fmt = ctx.obj.get("output_format", "table") if ctx.obj else "table"
         output(availability, output_format=fmt, table_type="gpu_check")
     except RpctlError as e:
-        from rich.console import Console
-
-        Console(stderr=True).print(f"[red]Error:[/red] {e}")
+        err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
 
 
@@ -88,9 +86,7 @@ def regions(
         fmt = ctx.obj.get("output_format", "table") if ctx.obj else "table"
         output(datacenters, output_format=fmt, table_type="regions")
     except RpctlError as e:
-        from rich.console import Console
-
-        Console(stderr=True).print(f"[red]Error:[/red] {e}")
+        err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
 
 
@@ -102,9 +98,7 @@ def compare(
 ) -> None:
     """Compare GPUs side-by-side on pricing and availability."""
     if len(gpus) < 2:
-        from rich.console import Console
-
-        Console(stderr=True).print("[red]Provide at least 2 GPU types to compare.[/red]")
+        err_console.print("[red]Provide at least 2 GPU types to compare.[/red]")
         raise typer.Exit(code=1)
 
     try:
@@ -120,9 +114,7 @@ def compare(
         fmt = ctx.obj.get("output_format", "table") if ctx.obj else "table"
         output(matched, output_format=fmt, table_type="gpu_compare")
     except RpctlError as e:
-        from rich.console import Console
-
-        Console(stderr=True).print(f"[red]Error:[/red] {e}")
+        err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
 
 
@@ -137,7 +129,5 @@ def cpus(
         fmt = ctx.obj.get("output_format", "table") if ctx.obj else "table"
         output(cpu_types, output_format=fmt, table_type="cpu_list")
     except RpctlError as e:
-        from rich.console import Console
-
-        Console(stderr=True).print(f"[red]Error:[/red] {e}")
+        err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
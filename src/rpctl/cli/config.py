@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from rpctl.config.settings import Settings, get_config_dir
 from rpctl.errors import ConfigError
@@ -92,6 +91,8 @@ def show(
         typer.echo(json.dumps(display, indent=2))
         return
 
+    from rich.table import Table  # deferred: keeps `rpctl --help` from loading rich.table
+
     table = Table(title="Active Configuration", show_header=False)
     table.add_column("Key", style="cyan")
     table.add_column("Value")
@@ -120,6 +121,8 @@ def list_profiles(
         typer.echo(json.dumps({"active": active, "profiles": profiles}, indent=2))
         return
 
+    from rich.table import Table
+
     table = Table(title="Profiles")
     table.add_column("Name", style="cyan")
     table.add_column("Active", justify="center")
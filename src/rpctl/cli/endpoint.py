@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from rpctl.services.endpoint_service import EndpointService
 
 app = typer.Typer(no_args_is_help=True)
+console = Console()
 err_console = Console(stderr=True)
 
 
@@ -144,7 +145,7 @@ def create(
             params=params.model_dump(exclude_none=True),
         )
         path = preset_svc.save(to_save, overwrite=True)
-        Console().print(f"[green]Preset '{save_preset}' saved to {path}[/green]")
+        console.print(f"[green]Preset '{save_preset}' saved to {path}[/green]")
 
     # Step 5: Dry run or create
     if dry_run:
@@ -290,7 +291,7 @@ def run(
             output(result, output_format=fmt, table_type="endpoint_run_result")
         else:
             job_id = svc.run_async(endpoint_id, request_input)
-            Console().print(f"[green]Job submitted: {job_id}[/green]")
+            console.print(f"[green]Job submitted: {job_id}[/green]")
     except RpctlError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -388,7 +389,7 @@ def delete(
     try:
         svc = _get_endpoint_service(ctx)
         svc.delete_endpoint(endpoint_id)
-        Console().print(f"[green]Endpoint {endpoint_id} deleted.[/green]")
+        console.print(f"[green]Endpoint {endpoint_id} deleted.[/green]")
     except RpctlError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from rpctl.services.pod_service import PodService
 
 app = typer.Typer(no_args_is_help=True)
+console = Console()
 err_console = Console(stderr=True)
 
 
@@ -200,7 +201,7 @@ def create(
             params=params.model_dump(exclude_none=True),
         )
         path = preset_svc.save(to_save, overwrite=True)
-        Console().print(f"[green]Preset '{save_preset}' saved to {path}[/green]")
+        console.print(f"[green]Preset '{save_preset}' saved to {path}[/green]")
 
     # Step 5: Dry run or create
     if dry_run:
@@ -257,7 +258,7 @@ def start(
     try:
         svc = _get_pod_service(ctx)
         svc.start_pod(pod_id)
-        Console().print(f"[green]Pod {pod_id} started.[/green]")
+        console.print(f"[green]Pod {pod_id} started.[/green]")
     except RpctlError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -272,7 +273,7 @@ def stop(
     try:
         svc = _get_pod_service(ctx)
         svc.stop_pod(pod_id)
-        Console().print(f"[green]Pod {pod_id} stopped.[/green]")
+        console.print(f"[green]Pod {pod_id} stopped.[/green]")
     except RpctlError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -287,7 +288,7 @@ def restart(
     try:
         svc = _get_pod_service(ctx)
         svc.restart_pod(pod_id)
-        Console().print(f"[green]Pod {pod_id} restarted.[/green]")
+        console.print(f"[green]Pod {pod_id} restarted.[/green]")
     except RpctlError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -306,7 +307,7 @@ def delete(
     try:
         svc = _get_pod_service(ctx)
         svc.delete_pod(pod_id)
-        Console().print(f"[green]Pod {pod_id} deleted.[/green]")
+        console.print(f"[green]Pod {pod_id} deleted.[/green]")
     except RpctlError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -351,17 +352,15 @@ def stop_all(
         raise typer.Exit(code=e.exit_code) from None
 
     if not pods:
-        Console().print("[yellow]No running pods to stop.[/yellow]")
+        console.print("[yellow]No running pods to stop.[/yellow]")
         return
 
     if not confirm:
         typer.confirm(f"Stop {len(pods)} running pod(s)?", abort=True)
 
     if parallel:
-        from rpctl.services.parallel import parallel_map
-
-        result = parallel_map(lambda p: svc.stop_pod(p.id), pods, max_workers=max_workers)
-        Console().print(f"[green]Stopped {len(result.succeeded)} pod(s).[/green]")
+        result = svc.stop_pods([p.id for p in pods], max_workers=max_workers)
+        console.print(f"[green]Stopped {len(result.succeeded)} pod(s).[/green]")
         for _item, exc in result.failed:
             err_console.print(f"[red]Failed to stop pod: {exc}[/red]")
         if result.failed:
@@ -370,7 +369,7 @@ def stop_all(
         for pod in pods:
             try:
                 svc.stop_pod(pod.id)
-                Console().print(f"[green]Stopped {pod.id} ({pod.name})[/green]")
+                console.print(f"[green]Stopped {pod.id} ({pod.name})[/green]")
             except RpctlError as e:
                 err_console.print(f"[red]Failed to stop {pod.id}: {e}[/red]")
 
@@ -391,7 +390,7 @@ def delete_all(
         raise typer.Exit(code=e.exit_code) from None
 
     if not pods:
-        Console().print("[yellow]No pods to delete.[/yellow]")
+        console.print("[yellow]No pods to delete.[/yellow]")
         return
 
     if not confirm:
@@ -401,10 +400,8 @@ def delete_all(
         )
 
     if parallel:
-        from rpctl.services.parallel import parallel_map
-
-        result = parallel_map(lambda p: svc.delete_pod(p.id), pods, max_workers=max_workers)
-        Console().print(f"[green]Deleted {len(result.succeeded)} pod(s).[/green]")
+        result = svc.delete_pods([p.id for p in pods], max_workers=max_workers)
+        console.print(f"[green]Deleted {len(result.succeeded)} pod(s).[/green]")
         for _item, exc in result.failed:
             err_console.print(f"[red]Failed to delete pod: {exc}[/red]")
         if result.failed:
@@ -413,6 +410,6 @@ def delete_all(
         for pod in pods:
             try:
                 svc.delete_pod(pod.id)
-                Console().print(f"[green]Deleted {pod.id} ({pod.name})[/green]")
+                console.print(f"[green]Deleted {pod.id} ({pod.name})[/green]")
             except RpctlError as e:
                 err_console.print(f"[red]Failed to delete {pod.id}: {e}[/red]")
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from rpctl.services.preset_service import PresetService
 
 app = typer.Typer(no_args_is_help=True)
+console = Console()
 err_console = Console(stderr=True)
 
 
@@ -158,7 +159,7 @@ def save(
 
     try:
         path = svc.save(preset, overwrite=overwrite)
-        Console().print(f"[green]Preset '{name}' saved to {path}[/green]")
+        console.print(f"[green]Preset '{name}' saved to {path}[/green]")
     except PresetError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -202,7 +203,7 @@ def delete(
     try:
         svc = _get_preset_service()
         svc.delete(name)
-        Console().print(f"[green]Preset '{name}' deleted.[/green]")
+        console.print(f"[green]Preset '{name}' deleted.[/green]")
     except PresetError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from rpctl.services.registry_service import RegistryService
 
 app = typer.Typer(no_args_is_help=True)
+console = Console()
 err_console = Console(stderr=True)
 
 
@@ -90,7 +91,7 @@ def delete(
     try:
         svc = _get_registry_service(ctx)
         svc.delete(registry_auth_id)
-        Console().print(f"[green]Registry auth {registry_auth_id} deleted.[/green]")
+        console.print(f"[green]Registry auth {registry_auth_id} deleted.[/green]")
     except RpctlError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from rpctl.services.pod_service import PodService
 
 app = typer.Typer(no_args_is_help=True)
+console = Console()
 err_console = Console(stderr=True)
 
 
@@ -102,9 +103,9 @@ def ssh_connect(
     cmd = _build_ssh_command(host, port, user=user, key_file=key, remote_command=command)
 
     if dry_run:
-        Console().print(" ".join(cmd))
+        console.print(" ".join(cmd))
         return
 
     # Replace current process with ssh
-    Console(stderr=True).print(f"[dim]Connecting to {pod.name or pod_id}...[/dim]")
+    err_console.print(f"[dim]Connecting to {pod.name or pod_id}...[/dim]")
     os.execvp("ssh", cmd)
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from rpctl.services.template_service import TemplateService
 
 app = typer.Typer(no_args_is_help=True)
+console = Console()
 err_console = Console(stderr=True)
 
 
@@ -164,7 +165,7 @@ def delete(
     try:
         svc = _get_template_service(ctx)
         svc.delete_template(template_id)
-        Console().print(f"[green]Template {template_id} deleted.[/green]")
+        console.print(f"[green]Template {template_id} deleted.[/green]")
     except RpctlError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from rpctl.services.user_service import UserService
 
 app = typer.Typer(no_args_is_help=True)
+console = Console()
 err_console = Console(stderr=True)
 
 
@@ -65,7 +66,7 @@ def set_ssh_key(
             path = Path(default_key).expanduser()
             if path.exists():
                 pubkey = path.read_text().strip()
-                Console().print(f"[dim]Using key: {path}[/dim]")
+                console.print(f"[dim]Using key: {path}[/dim]")
                 break
         else:
             err_console.print("[red]No SSH key found. Use --key or --text to specify one.[/red]")
@@ -74,7 +75,7 @@ def set_ssh_key(
     try:
         svc = _get_user_service(ctx)
         svc.set_ssh_key(pubkey)
-        Console().print("[green]SSH public key updated.[/green]")
+        console.print("[green]SSH public key updated.[/green]")
     except RpctlError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from rpctl.services.volume_service import VolumeService
 
 app = typer.Typer(no_args_is_help=True)
+console = Console()
 err_console = Console(stderr=True)
 
 
@@ -120,7 +121,7 @@ def delete(
     try:
         svc = _get_volume_service(ctx)
         svc.delete_volume(volume_id)
-        Console().print(f"[green]Volume {volume_id} deleted.[/green]")
+        console.print(f"[green]Volume {volume_id} deleted.[/green]")
     except RpctlError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=e.exit_code) from None
@@ -24,6 +24,8 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_BASE_DELAY = 1.0
 DEFAULT_RETRY_MAX_DELAY = 30.0
 
+STRICT_VALIDATE_ENV = "RPCTL_STRICT_VALIDATE"
+
 GPU_TYPE_IDS = [
     "NVIDIA A100 80GB PCIe",
     "NVIDIA A100-SXM4-80GB",
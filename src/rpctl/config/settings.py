@@ -6,8 +6,6 @@ import os
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from rpctl.config.constants import (
     CONFIG_DIR_NAME,
     CONFIG_FILE_NAME,
@@ -44,6 +42,8 @@ class Settings:
         if not path.exists():
             raise ConfigError(f"Config file not found: {path}. Run 'rpctl config init'.")
 
+        import yaml  # deferred: keeps `rpctl --help` from loading PyYAML
+
         with open(path) as f:
             data = yaml.safe_load(f) or {}
 
@@ -76,6 +76,8 @@ class Settings:
 
     def save(self) -> None:
         """Write the config to disk."""
+        import yaml
+
         path = self._config_path
         path.parent.mkdir(parents=True, exist_ok=True)
         with open(path, "w") as f:
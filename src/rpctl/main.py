@@ -46,7 +46,9 @@ def main(
     ctx.obj["profile"] = profile
     # Resolve output format: --output takes precedence over --json
     if output_format:
-        ctx.obj["output_format"] = output_format
+        # Interned so the per-call format lookups in output() compare by identity,
+        # like the literal table_type keys already do.
+        ctx.obj["output_format"] = sys.intern(output_format)
     elif json_output:
         ctx.obj["output_format"] = "json"
     else:
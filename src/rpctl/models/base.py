@@ -0,0 +1,57 @@
+"""Shared helpers for building models from RunPod API responses."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from rpctl.config.constants import STRICT_VALIDATE_ENV
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class ApiModel(BaseModel):
+    """Base for resource models parsed from RunPod API responses.
+
+    Pins the settings the ``from_api`` path relies on: unknown keys are
+    dropped, and already-built instances are never re-validated when nested
+    in another model. Pydantic models cannot use ``__slots__`` for fields.
+    """
+
+    model_config = ConfigDict(extra="ignore", revalidate_instances="never")
+
+
+def strict_validation() -> bool:
+    """Whether API responses should be fully validated (set ``RPCTL_STRICT_VALIDATE=1``)."""
+    return os.environ.get(STRICT_VALIDATE_ENV, "") not in ("", "0")
+
+
+def build_from_api(cls: type[M], fields: dict[str, Any]) -> M:
+    """Build *cls* from already-normalized API fields.
+
+    ``from_api`` parsers map the trusted API shape onto model field names and
+    coerce each value to its field's type (``int``/``float``, ``""``/``0`` for
+    nulls), so validation is skipped via ``model_construct`` unless strict mode
+    is enabled.
+    """
+    if strict_validation():
+        return cls.model_validate(fields)
+    return cls.model_construct(**fields)
+
+
+def build_list_from_api(
+    cls: type[M],
+    adapter: TypeAdapter[list[M]],
+    rows: Iterable[dict[str, Any]],
+) -> list[M]:
+    """Build a list of *cls* from normalized API rows.
+
+    Strict mode validates the whole batch with the model's cached list *adapter*.
+    """
+    if strict_validation():
+        return adapter.validate_python(list(rows))
+    construct = cls.model_construct
+    return [construct(**fields) for fields in rows]
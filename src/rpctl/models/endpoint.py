@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
+from rpctl.models.base import ApiModel, build_from_api, build_list_from_api
 
-class Endpoint(BaseModel):
+
+class Endpoint(ApiModel):
     """A RunPod serverless endpoint."""
 
     id: str
@@ -32,26 +34,40 @@ class Endpoint(BaseModel):
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> Endpoint:
         """Parse from RunPod API endpoint response."""
-        return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            template_id=data.get("templateId", ""),
-            gpu_ids=data.get("gpuIds", data.get("gpuTypeIds", "")),
-            gpu_count=data.get("gpuCount", 0),
-            workers_min=data.get("workersMin", 0),
-            workers_max=data.get("workersMax", 0),
-            workers_current=data.get("workersCurrent", data.get("workersRunning", 0)),
-            idle_timeout=data.get("idleTimeout", 5),
-            locations=data.get("locations", data.get("dataCenterIds", "")),
-            network_volume_id=data.get("networkVolumeId"),
-            scaler_type=data.get("scalerType", ""),
-            scaler_value=data.get("scalerValue", 0),
-            flashboot=data.get("flashboot", False),
-            queue_delay=data.get("queueDelay", 0),
-            jobs_in_progress=data.get("jobsInProgress", 0),
-            jobs_completed=data.get("jobsCompleted", 0),
-            workers_ready=data.get("workersReady", 0),
-        )
+        return build_from_api(cls, cls._api_fields(data))
+
+    @classmethod
+    def from_api_list(cls, items: list[dict[str, Any]]) -> list[Endpoint]:
+        """Parse a list response, validating in one batch in strict mode."""
+        return build_list_from_api(cls, _ENDPOINT_LIST_ADAPTER, [cls._api_fields(d) for d in items])
+
+    @staticmethod
+    def _api_fields(data: dict[str, Any]) -> dict[str, Any]:
+        """Map API keys onto model field names."""
+        idle_timeout = data.get("idleTimeout")
+        return {
+            "id": data.get("id") or "",
+            "name": data.get("name") or "",
+            "template_id": data.get("templateId") or "",
+            "gpu_ids": data.get("gpuIds") or data.get("gpuTypeIds") or "",
+            "gpu_count": int(data.get("gpuCount") or 0),
+            "workers_min": int(data.get("workersMin") or 0),
+            "workers_max": int(data.get("workersMax") or 0),
+            "workers_current": int(data.get("workersCurrent") or data.get("workersRunning") or 0),
+            "idle_timeout": 5 if idle_timeout is None else int(idle_timeout),
+            "locations": data.get("locations") or data.get("dataCenterIds") or "",
+            "network_volume_id": data.get("networkVolumeId"),
+            "scaler_type": data.get("scalerType") or "",
+            "scaler_value": int(data.get("scalerValue") or 0),
+            "flashboot": bool(data.get("flashboot")),
+            "queue_delay": int(data.get("queueDelay") or 0),
+            "jobs_in_progress": int(data.get("jobsInProgress") or 0),
+            "jobs_completed": int(data.get("jobsCompleted") or 0),
+            "workers_ready": int(data.get("workersReady") or 0),
+        }
+
+
+_ENDPOINT_LIST_ADAPTER = TypeAdapter(list[Endpoint])
 
 
 class EndpointCreateParams(BaseModel):
@@ -73,22 +89,27 @@ class EndpointCreateParams(BaseModel):
 
     def to_sdk_kwargs(self) -> dict[str, Any]:
         """Convert to kwargs for runpod.create_endpoint()."""
-        kwargs: dict[str, Any] = {
-            "name": self.name,
-            "template_id": self.template_id,
-            "gpu_ids": self.gpu_ids,
-            "workers_min": self.workers_min,
-            "workers_max": self.workers_max,
-            "idle_timeout": self.idle_timeout,
-            "scaler_type": self.scaler_type,
-            "scaler_value": self.scaler_value,
-        }
-        if self.network_volume_id:
-            kwargs["network_volume_id"] = self.network_volume_id
-        if self.flashboot:
-            kwargs["flashboot"] = True
-        if self.locations:
-            kwargs["locations"] = self.locations
+        kwargs: dict[str, Any] = {field: getattr(self, field) for field in _SDK_ALWAYS}
+        for field in _SDK_IF_SET:
+            value = getattr(self, field)
+            if value:
+                kwargs[field] = value
         if self.allowed_cuda_versions:
             kwargs["allowed_cuda_versions"] = ",".join(self.allowed_cuda_versions)
         return kwargs
+
+
+# Fields always sent to runpod.create_endpoint() (names match the SDK kwargs).
+_SDK_ALWAYS = (
+    "name",
+    "template_id",
+    "gpu_ids",
+    "workers_min",
+    "workers_max",
+    "idle_timeout",
+    "scaler_type",
+    "scaler_value",
+)
+
+# Fields only sent when truthy.
+_SDK_IF_SET = ("network_volume_id", "flashboot", "locations")
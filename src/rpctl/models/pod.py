@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from rpctl.models.base import ApiModel, build_from_api, build_list_from_api
 
-class Pod(BaseModel):
+
+class Pod(ApiModel):
     """A RunPod GPU/CPU pod."""
 
     id: str
@@ -32,32 +34,45 @@ class Pod(BaseModel):
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> Pod:
         """Parse from RunPod SDK pod response."""
+        return build_from_api(cls, cls._api_fields(data))
+
+    @classmethod
+    def from_api_list(cls, items: list[dict[str, Any]]) -> list[Pod]:
+        """Parse a list response, validating in one batch in strict mode."""
+        return build_list_from_api(cls, _POD_LIST_ADAPTER, [cls._api_fields(d) for d in items])
+
+    @staticmethod
+    def _api_fields(data: dict[str, Any]) -> dict[str, Any]:
+        """Map API keys onto model field names."""
         runtime = data.get("runtime") or {}
         machine = data.get("machine") or {}
         gpu_type = machine.get("gpuDisplayName", "")
         if not gpu_type:
             gpu_type = data.get("gpuTypeId", data.get("gpu", ""))
 
-        return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            image_name=data.get("imageName", ""),
-            status=runtime.get("status", data.get("desiredStatus", "")),
-            desired_status=data.get("desiredStatus", ""),
-            gpu_type=gpu_type,
-            gpu_count=data.get("gpuCount", 0),
-            vcpu_count=data.get("vcpu", 0),
-            memory_mb=data.get("memoryInGb", 0) * 1024 if data.get("memoryInGb") else 0,
-            container_disk_gb=data.get("containerDiskInGb", 0),
-            volume_disk_gb=data.get("volumeInGb", 0),
-            volume_mount_path=data.get("volumeMountPath", ""),
-            cost_per_hr=data.get("costPerHr", 0.0),
-            machine_id=data.get("machineId", machine.get("id", "")),
-            cloud_type=data.get("cloudType", ""),
-            ports=data.get("port", data.get("ports", "")),
-            runtime=runtime,
-            env=data.get("env", []),
-        )
+        return {
+            "id": data.get("id") or "",
+            "name": data.get("name") or "",
+            "image_name": data.get("imageName") or "",
+            "status": runtime.get("status") or data.get("desiredStatus") or "",
+            "desired_status": data.get("desiredStatus") or "",
+            "gpu_type": gpu_type or "",
+            "gpu_count": int(data.get("gpuCount") or 0),
+            "vcpu_count": int(data.get("vcpu") or 0),
+            "memory_mb": int((data.get("memoryInGb") or 0) * 1024),
+            "container_disk_gb": int(data.get("containerDiskInGb") or 0),
+            "volume_disk_gb": int(data.get("volumeInGb") or 0),
+            "volume_mount_path": data.get("volumeMountPath") or "",
+            "cost_per_hr": float(data.get("costPerHr") or 0.0),
+            "machine_id": data.get("machineId") or machine.get("id") or "",
+            "cloud_type": data.get("cloudType") or "",
+            "ports": data.get("port") or data.get("ports") or "",
+            "runtime": runtime,
+            "env": data.get("env") or [],
+        }
+
+
+_POD_LIST_ADAPTER = TypeAdapter(list[Pod])
 
 
 class PodCreateParams(BaseModel):
@@ -93,46 +108,48 @@ class PodCreateParams(BaseModel):
 
     def to_sdk_kwargs(self) -> dict[str, Any]:
         """Convert to kwargs for runpod.create_pod()."""
-        kwargs: dict[str, Any] = {
-            "name": self.name,
-            "image_name": self.image_name,
-            "gpu_count": self.gpu_count,
-            "cloud_type": self.cloud_type,
-            "container_disk_in_gb": self.container_disk_in_gb,
-            "volume_in_gb": self.volume_in_gb,
-            "volume_mount_path": self.volume_mount_path,
-            "ports": self.ports,
-            "min_vcpu_count": self.min_vcpu_per_gpu,
-            "min_memory_in_gb": self.min_ram_per_gpu,
-        }
-        if self.gpu_type_id:
-            kwargs["gpu_type_id"] = self.gpu_type_id
-        if self.gpu_type_ids:
-            kwargs["gpu_type_ids"] = self.gpu_type_ids
-        if self.network_volume_id:
-            kwargs["network_volume_id"] = self.network_volume_id
-        if self.env:
-            kwargs["env"] = self.env
-        if self.docker_entrypoint:
-            kwargs["docker_args"] = self.docker_entrypoint
-        if self.docker_start_cmd:
-            kwargs["docker_start_cmd"] = self.docker_start_cmd
-        if self.template_id:
-            kwargs["template_id"] = self.template_id
+        kwargs: dict[str, Any] = {sdk: getattr(self, field) for field, sdk in _SDK_ALWAYS}
+        for field, sdk in _SDK_IF_SET:
+            value = getattr(self, field)
+            if value:
+                kwargs[sdk] = value
         if self.data_center_ids:
             kwargs["data_center_id"] = self.data_center_ids[0]
         if self.interruptible:
             kwargs["bid_per_gpu"] = 0.0  # Will use market rate
-        if self.allowed_cuda_versions:
-            kwargs["allowed_cuda_versions"] = self.allowed_cuda_versions
-        if self.support_public_ip:
-            kwargs["support_public_ip"] = True
         if not self.start_ssh:
             kwargs["start_ssh"] = False
-        if self.country_code:
-            kwargs["country_code"] = self.country_code
         if self.min_download is not None:
             kwargs["min_download"] = self.min_download
         if self.min_upload is not None:
             kwargs["min_upload"] = self.min_upload
         return kwargs
+
+
+# (model field, runpod.create_pod kwarg) pairs that are always sent.
+_SDK_ALWAYS = (
+    ("name", "name"),
+    ("image_name", "image_name"),
+    ("gpu_count", "gpu_count"),
+    ("cloud_type", "cloud_type"),
+    ("container_disk_in_gb", "container_disk_in_gb"),
+    ("volume_in_gb", "volume_in_gb"),
+    ("volume_mount_path", "volume_mount_path"),
+    ("ports", "ports"),
+    ("min_vcpu_per_gpu", "min_vcpu_count"),
+    ("min_ram_per_gpu", "min_memory_in_gb"),
+)
+
+# Pairs that are only sent when the field is truthy.
+_SDK_IF_SET = (
+    ("gpu_type_id", "gpu_type_id"),
+    ("gpu_type_ids", "gpu_type_ids"),
+    ("network_volume_id", "network_volume_id"),
+    ("env", "env"),
+    ("docker_entrypoint", "docker_args"),
+    ("docker_start_cmd", "docker_start_cmd"),
+    ("template_id", "template_id"),
+    ("allowed_cuda_versions", "allowed_cuda_versions"),
+    ("support_public_ip", "support_public_ip"),
+    ("country_code", "country_code"),
+)
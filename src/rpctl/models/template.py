@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field, TypeAdapter
 
+from rpctl.models.base import ApiModel, build_from_api, build_list_from_api
 
-class Template(BaseModel):
+
+class Template(ApiModel):
     """A RunPod template."""
 
     id: str
@@ -26,17 +28,30 @@ class Template(BaseModel):
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> Template:
         """Parse from RunPod API template response."""
-        return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            image_name=data.get("imageName", ""),
-            container_disk_gb=data.get("containerDiskInGb", 0),
-            volume_gb=data.get("volumeInGb", 0),
-            volume_mount_path=data.get("volumeMountPath", ""),
-            ports=data.get("ports", ""),
-            is_serverless=data.get("isServerless", False),
-            is_public=data.get("isPublic", False),
-            env=data.get("env", []),
-            category=data.get("category", ""),
-            readme=data.get("readme", ""),
-        )
+        return build_from_api(cls, cls._api_fields(data))
+
+    @classmethod
+    def from_api_list(cls, items: list[dict[str, Any]]) -> list[Template]:
+        """Parse a list response, validating in one batch in strict mode."""
+        return build_list_from_api(cls, _TEMPLATE_LIST_ADAPTER, [cls._api_fields(d) for d in items])
+
+    @staticmethod
+    def _api_fields(data: dict[str, Any]) -> dict[str, Any]:
+        """Map API keys onto model field names."""
+        return {
+            "id": data.get("id") or "",
+            "name": data.get("name") or "",
+            "image_name": data.get("imageName") or "",
+            "container_disk_gb": int(data.get("containerDiskInGb") or 0),
+            "volume_gb": int(data.get("volumeInGb") or 0),
+            "volume_mount_path": data.get("volumeMountPath") or "",
+            "ports": data.get("ports") or "",
+            "is_serverless": bool(data.get("isServerless")),
+            "is_public": bool(data.get("isPublic")),
+            "env": data.get("env") or [],
+            "category": data.get("category") or "",
+            "readme": data.get("readme") or "",
+        }
+
+
+_TEMPLATE_LIST_ADAPTER = TypeAdapter(list[Template])
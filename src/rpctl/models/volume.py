@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import TypeAdapter
 
+from rpctl.models.base import ApiModel, build_from_api, build_list_from_api
 
-class Volume(BaseModel):
+
+class Volume(ApiModel):
     """A RunPod network volume."""
 
     id: str
@@ -19,10 +21,23 @@ class Volume(BaseModel):
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> Volume:
         """Parse from RunPod API volume response."""
-        return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            size_gb=data.get("size", data.get("sizeInGb", 0)),
-            data_center_id=data.get("dataCenterId", ""),
-            used_size_gb=data.get("usedSize", 0.0),
-        )
+        return build_from_api(cls, cls._api_fields(data))
+
+    @classmethod
+    def from_api_list(cls, items: list[dict[str, Any]]) -> list[Volume]:
+        """Parse a list response, validating in one batch in strict mode."""
+        return build_list_from_api(cls, _VOLUME_LIST_ADAPTER, [cls._api_fields(d) for d in items])
+
+    @staticmethod
+    def _api_fields(data: dict[str, Any]) -> dict[str, Any]:
+        """Map API keys onto model field names."""
+        return {
+            "id": data.get("id") or "",
+            "name": data.get("name") or "",
+            "size_gb": int(data.get("size") or data.get("sizeInGb") or 0),
+            "data_center_id": data.get("dataCenterId") or "",
+            "used_size_gb": float(data.get("usedSize") or 0.0),
+        }
+
+
+_VOLUME_LIST_ADAPTER = TypeAdapter(list[Volume])
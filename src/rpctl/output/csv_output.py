@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+import io
 import sys
 from typing import Any
 
@@ -11,38 +12,50 @@ from pydantic import BaseModel
 
 def print_csv(data: Any, *, table_type: str = "") -> None:
     """Print data as CSV to stdout."""
-    if isinstance(data, BaseModel):
-        rows = [data.model_dump(exclude_none=True)]
-    elif isinstance(data, list):
-        rows = [
-            item.model_dump(exclude_none=True) if isinstance(item, BaseModel) else item
-            for item in data
-        ]
-    elif isinstance(data, dict):
-        rows = [data]
+    items: list[Any]
+    if isinstance(data, list):
+        items = data
+    elif isinstance(data, (BaseModel, dict)):
+        items = [data]
     else:
-        rows = [{"value": str(data)}]
+        items = [{"value": str(data)}]
 
-    if not rows:
+    if not items:
         return
 
-    flat_rows = [_flatten(r) if isinstance(r, dict) else {"value": str(r)} for r in rows]
-    fieldnames = list(flat_rows[0].keys())
+    rows = (_flat_row(item) for item in items)
+    first = next(rows)
 
-    writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames, extrasaction="ignore")
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=list(first), extrasaction="ignore")
     writer.writeheader()
-    writer.writerows(flat_rows)
+    writer.writerow(first)
+    writer.writerows(rows)
+    sys.stdout.write(buf.getvalue())
+
+
+def _flat_row(item: Any) -> dict[str, Any]:
+    """Turn one list item into a flat CSV row."""
+    if isinstance(item, BaseModel):
+        return _flatten(item.model_dump(exclude_none=True))
+    if isinstance(item, dict):
+        return _flatten(item)
+    return {"value": str(item)}
 
 
 def _flatten(d: dict[str, Any], parent_key: str = "", sep: str = ".") -> dict[str, Any]:
     """Flatten nested dicts for CSV output."""
-    items: list[tuple[str, Any]] = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(_flatten(v, new_key, sep).items())
-        elif isinstance(v, list):
-            items.append((new_key, ";".join(str(i) for i in v)))
+    out: dict[str, Any] = {}
+    # Stack of (key prefix, item iterator); iterators keep depth-first key order.
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, it = stack[-1]
+        for k, v in it:
+            key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((key, iter(v.items())))
+                break
+            out[key] = ";".join(map(str, v)) if isinstance(v, list) else v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return out
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from rpctl.output.csv_output import print_csv
@@ -64,6 +65,15 @@ TABLE_RENDERERS = {
 }
 
 
+# Non-table formats. The lambdas resolve the printer names at call time so
+# patching e.g. ``rpctl.output.formatter.print_csv`` still takes effect.
+_FORMAT_DISPATCH: dict[str, Callable[[Any, str], None]] = {
+    "json": lambda data, _table_type: print_json(data),
+    "csv": lambda data, table_type: print_csv(data, table_type=table_type),
+    "yaml": lambda data, _table_type: print_yaml(data),
+}
+
+
 def output(
     data: Any,
     *,
@@ -75,19 +85,15 @@ def output(
 
     Precedence: explicit output_format > json_mode shorthand > table default.
     """
-    fmt = output_format
-    if fmt == "table" and json_mode:
-        fmt = "json"
+    fmt = "json" if json_mode and output_format == "table" else output_format
 
-    if fmt == "json":
-        print_json(data)
-    elif fmt == "csv":
-        print_csv(data, table_type=table_type)
-    elif fmt == "yaml":
-        print_yaml(data)
+    handler = _FORMAT_DISPATCH.get(fmt)
+    if handler is not None:
+        handler(data, table_type)
+        return
+
+    renderer = TABLE_RENDERERS.get(table_type)
+    if renderer:
+        renderer(data)
     else:
-        renderer = TABLE_RENDERERS.get(table_type)
-        if renderer:
-            renderer(data)
-        else:
-            print_json(data)
+        print_json(data)
@@ -2,17 +2,68 @@
 
 from __future__ import annotations
 
+import dataclasses
+import datetime
+import enum
 import json
+import re
 from typing import Any
 
 import typer
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup (pip install rpctl[fast])
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    # Datetimes and dataclasses go through _default, as they do for the stdlib.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+# ``null`` may be a non-finite float (stdlib: NaN/Infinity); a digit followed
+# by ``e`` may be an exponent float, which the two encoders spell differently.
+_ORJSON_MAY_DIFFER = re.compile(rb"null|\d[eE]")
+
 
 def print_json(data: Any) -> None:
     """Print data as formatted JSON to stdout."""
     serialized = [_serialize(item) for item in data] if isinstance(data, list) else _serialize(data)
-    typer.echo(json.dumps(serialized, indent=2, default=str))
+    typer.echo(_dumps(serialized))
+
+
+def _dumps(obj: Any) -> str:
+    """Encode with orjson when installed, falling back to the stdlib encoder.
+
+    The stdlib encoder defines the output. orjson formats a few things
+    differently (non-ASCII, NaN/Infinity as ``null``, exponent floats) and
+    cannot encode ints wider than 64 bits, so any orjson result that might
+    differ is re-encoded with the stdlib.
+    """
+    if orjson is not None:
+        try:
+            raw = orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError:  # includes orjson.JSONEncodeError
+            pass
+        else:
+            if raw.isascii() and not _ORJSON_MAY_DIFFER.search(raw):
+                return raw.decode()
+    return json.dumps(obj, indent=2, default=_default)
+
+
+def _default(obj: Any) -> Any:
+    """Encode values JSON has no type for; shared by both encoders."""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return str(obj)
 
 
 def _serialize(obj: Any) -> Any:
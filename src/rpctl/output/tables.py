@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel
 from rich.console import Console
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.table import Table
 
 console = Console()
 
@@ -17,35 +19,125 @@ def _price_str(value: float | None) -> str:
     return f"${value:.4f}/hr"
 
 
+_STOCK_COLORS = {"high": "green", "low": "yellow", "unavailable": "red", "none": "red"}
+
+_STATUS_COLORS = {
+    "running": "green",
+    "ready": "green",
+    "exited": "yellow",
+    "stopped": "yellow",
+    "error": "red",
+    "failed": "red",
+}
+
+
 def _stock_style(status: str | None) -> str:
     if not status:
         return "[dim]-[/dim]"
-    lower = status.lower()
-    if lower == "high":
-        return f"[green]{status}[/green]"
-    if lower == "low":
-        return f"[yellow]{status}[/yellow]"
-    if lower in ("unavailable", "none"):
-        return f"[red]{status}[/red]"
-    return status
+    color = _STOCK_COLORS.get(status.casefold())
+    return f"[{color}]{status}[/{color}]" if color else status
 
 
 def _status_style(status: str) -> str:
-    lower = status.lower()
-    if lower in ("running", "ready"):
-        return f"[green]{status}[/green]"
-    if lower in ("exited", "stopped"):
-        return f"[yellow]{status}[/yellow]"
-    if lower in ("error", "failed"):
-        return f"[red]{status}[/red]"
-    return status
+    color = _STATUS_COLORS.get(status.casefold())
+    return f"[{color}]{status}[/{color}]" if color else status
+
+
+# Column specs for the list renderers: (header, Table.add_column kwargs).
+_Columns = tuple[tuple[str, dict[str, Any]], ...]
+
+_GPU_LIST_COLUMNS: _Columns = (
+    ("GPU", {"style": "cyan", "no_wrap": True}),
+    ("VRAM", {"justify": "right"}),
+    ("Secure", {"justify": "right"}),
+    ("Community", {"justify": "right"}),
+    ("Spot (min bid)", {"justify": "right"}),
+    ("Stock", {"justify": "center"}),
+    ("Available", {"justify": "right"}),
+)
+
+_REGION_COLUMNS: _Columns = (
+    ("ID", {"style": "cyan", "no_wrap": True}),
+    ("Name", {}),
+    ("Location", {}),
+    ("Region", {}),
+    ("Storage", {"justify": "center"}),
+    ("GPUs Available", {"justify": "right"}),
+)
+
+_CPU_LIST_COLUMNS: _Columns = (
+    ("ID", {"style": "cyan", "no_wrap": True}),
+    ("Name", {}),
+    ("Manufacturer", {}),
+    ("Cores", {"justify": "right"}),
+    ("Threads/Core", {"justify": "right"}),
+    ("Group", {}),
+)
+
+_POD_LIST_COLUMNS: _Columns = (
+    ("ID", {"style": "cyan", "no_wrap": True}),
+    ("Name", {}),
+    ("Status", {"justify": "center"}),
+    ("GPU", {}),
+    ("Image", {}),
+    ("Cost/hr", {"justify": "right"}),
+)
+
+_ENDPOINT_LIST_COLUMNS: _Columns = (
+    ("ID", {"style": "cyan", "no_wrap": True}),
+    ("Name", {}),
+    ("GPU", {}),
+    ("Workers", {"justify": "center"}),
+    ("Idle Timeout", {"justify": "right"}),
+    ("Queue Delay", {"justify": "right"}),
+)
+
+_VOLUME_LIST_COLUMNS: _Columns = (
+    ("ID", {"style": "cyan", "no_wrap": True}),
+    ("Name", {}),
+    ("Size", {"justify": "right"}),
+    ("Used", {"justify": "right"}),
+    ("Datacenter", {}),
+)
+
+_TEMPLATE_LIST_COLUMNS: _Columns = (
+    ("ID", {"style": "cyan", "no_wrap": True}),
+    ("Name", {}),
+    ("Image", {}),
+    ("Type", {"justify": "center"}),
+)
+
+_PRESET_LIST_COLUMNS: _Columns = (
+    ("Name", {"style": "cyan", "no_wrap": True}),
+    ("Type", {"justify": "center"}),
+    ("Description", {}),
+    ("Key Params", {}),
+    ("Created", {}),
+)
+
+_FIELD_VALUE_COLUMNS: _Columns = (("Field", {"style": "cyan"}), ("Value", {}))
+
+_HEALTH_COLUMNS: _Columns = (("Metric", {"style": "cyan"}), ("Value", {"justify": "right"}))
+
+_REGISTRY_LIST_COLUMNS: _Columns = (
+    ("ID", {"style": "cyan", "no_wrap": True}),
+    ("Name", {}),
+)
+
+
+def _make_table(title: str, columns: _Columns, **table_kwargs: Any) -> Table:
+    """Build a Table with the given precomputed column specs."""
+    from rich.table import Table  # deferred: only needed when a table is rendered
+
+    table = Table(title=title, **table_kwargs)
+    for header, kwargs in columns:
+        table.add_column(header, **kwargs)
+    return table
 
 
 def _detail_table(title: str, data: BaseModel | dict[str, Any]) -> None:
     """Render any model/dict as a key-value detail table."""
-    table = Table(title=title, show_header=False)
-    table.add_column("Field", style="cyan")
-    table.add_column("Value")
+    table = _make_table(title, _FIELD_VALUE_COLUMNS, show_header=False)
 
     items: dict[str, Any]
     if isinstance(data, BaseModel):
@@ -78,14 +170,7 @@ def print_gpu_list(gpu_types: list[Any]) -> None:
         console.print("[dim]No GPU types found matching filters.[/dim]")
         return
 
-    table = Table(title="GPU Types — Pricing & Availability")
-    table.add_column("GPU", style="cyan", no_wrap=True)
-    table.add_column("VRAM", justify="right")
-    table.add_column("Secure", justify="right")
-    table.add_column("Community", justify="right")
-    table.add_column("Spot (min bid)", justify="right")
-    table.add_column("Stock", justify="center")
-    table.add_column("Available", justify="right")
+    table = _make_table("GPU Types — Pricing & Availability", _GPU_LIST_COLUMNS)
 
     for gpu in gpu_types:
         table.add_row(
@@ -104,9 +189,7 @@ def print_gpu_list(gpu_types: list[Any]) -> None:
 
 def print_gpu_check(detail: Any) -> None:
     """Render detailed GPU availability."""
-    table = Table(title=f"Availability — {detail.display_name}")
-    table.add_column("Field", style="cyan")
-    table.add_column("Value")
+    table = _make_table(f"Availability — {detail.display_name}", _FIELD_VALUE_COLUMNS)
 
     table.add_row("GPU", detail.display_name)
     table.add_row("VRAM", f"{detail.memory_gb} GB")
@@ -139,10 +222,10 @@ def print_gpu_compare(gpu_types: list[Any]) -> None:
         console.print("[dim]No GPUs to compare.[/dim]")
         return
 
-    table = Table(title="GPU Comparison")
-    table.add_column("Metric", style="cyan")
-    for gpu in gpu_types:
-        table.add_column(gpu.display_name, justify="right")
+    columns = (("Metric", {"style": "cyan"}),) + tuple(
+        (gpu.display_name, {"justify": "right"}) for gpu in gpu_types
+    )
+    table = _make_table("GPU Comparison", columns)
 
     table.add_row("VRAM", *[f"{g.memory_gb} GB" for g in gpu_types])
     table.add_row("Secure Price", *[_price_str(g.pricing.secure_price) for g in gpu_types])
@@ -168,13 +251,7 @@ def print_regions(datacenters: list[Any]) -> None:
         console.print("[dim]No datacenters found matching filters.[/dim]")
         return
 
-    table = Table(title="Datacenters — GPU Availability")
-    table.add_column("ID", style="cyan", no_wrap=True)
-    table.add_column("Name")
-    table.add_column("Location")
-    table.add_column("Region")
-    table.add_column("Storage", justify="center")
-    table.add_column("GPUs Available", justify="right")
+    table = _make_table("Datacenters — GPU Availability", _REGION_COLUMNS)
 
     for dc in datacenters:
         available_count = sum(1 for g in dc.gpus if g.available)
@@ -200,13 +277,7 @@ def print_cpu_list(cpu_types: list[Any]) -> None:
         console.print("[dim]No CPU types found.[/dim]")
         return
 
-    table = Table(title="CPU Types")
-    table.add_column("ID", style="cyan", no_wrap=True)
-    table.add_column("Name")
-    table.add_column("Manufacturer")
-    table.add_column("Cores", justify="right")
-    table.add_column("Threads/Core", justify="right")
-    table.add_column("Group")
+    table = _make_table("CPU Types", _CPU_LIST_COLUMNS)
 
     for cpu in cpu_types:
         table.add_row(
@@ -231,28 +302,27 @@ def print_pod_list(pods: list[Any]) -> None:
         console.print("[dim]No pods found.[/dim]")
         return
 
-    table = Table(title="Pods")
-    table.add_column("ID", style="cyan", no_wrap=True)
-    table.add_column("Name")
-    table.add_column("Status", justify="center")
-    table.add_column("GPU")
-    table.add_column("Image")
-    table.add_column("Cost/hr", justify="right")
+    table = _make_table("Pods", _POD_LIST_COLUMNS)
 
     for pod in pods:
-        table.add_row(
-            pod.id,
-            pod.name or "-",
-            _status_style(pod.status),
-            f"{pod.gpu_count}x {pod.gpu_type}" if pod.gpu_type else "-",
-            pod.image_name[:40] if pod.image_name else "-",
-            _price_str(pod.cost_per_hr) if pod.cost_per_hr else "-",
-        )
+        table.add_row(*_pod_row(pod))
 
     console.print(table)
     console.print(f"\n[dim]{len(pods)} pods listed.[/dim]")
 
 
+def _pod_row(pod: Any) -> tuple[str, ...]:
+    """Display cells for one pod, in _POD_LIST_COLUMNS order."""
+    return (
+        pod.id,
+        pod.name or "-",
+        _status_style(pod.status),
+        f"{pod.gpu_count}x {pod.gpu_type}" if pod.gpu_type else "-",
+        pod.image_name[:40] if pod.image_name else "-",
+        _price_str(pod.cost_per_hr) if pod.cost_per_hr else "-",
+    )
+
+
 def print_pod_detail(pod: Any) -> None:
     """Render pod detail view."""
     _detail_table(f"Pod — {pod.name or pod.id}", pod)
@@ -267,13 +337,7 @@ def print_endpoint_list(endpoints: list[Any]) -> None:
         console.print("[dim]No endpoints found.[/dim]")
         return
 
-    table = Table(title="Serverless Endpoints")
-    table.add_column("ID", style="cyan", no_wrap=True)
-    table.add_column("Name")
-    table.add_column("GPU")
-    table.add_column("Workers", justify="center")
-    table.add_column("Idle Timeout", justify="right")
-    table.add_column("Queue Delay", justify="right")
+    table = _make_table("Serverless Endpoints", _ENDPOINT_LIST_COLUMNS)
 
     for ep in endpoints:
         workers = f"{ep.workers_min}-{ep.workers_max} ({ep.workers_current} active)"
@@ -298,9 +362,7 @@ def print_endpoint_detail(endpoint: Any) -> None:
 def print_endpoint_health(health: Any) -> None:
     """Render endpoint health status."""
     if isinstance(health, dict):
-        table = Table(title="Endpoint Health")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", justify="right")
+        table = _make_table("Endpoint Health", _HEALTH_COLUMNS)
 
         workers = health.get("workers", {})
         jobs = health.get("jobs", {})
@@ -325,9 +387,7 @@ def print_endpoint_health(health: Any) -> None:
 def print_endpoint_run_result(result: Any) -> None:
     """Render endpoint run result."""
     if isinstance(result, dict):
-        table = Table(title="Endpoint Run Result")
-        table.add_column("Field", style="cyan")
-        table.add_column("Value")
+        table = _make_table("Endpoint Run Result", _FIELD_VALUE_COLUMNS)
         for key, val in result.items():
             table.add_row(str(key), str(val))
         console.print(table)
@@ -338,9 +398,7 @@ def print_endpoint_run_result(result: Any) -> None:
 def print_endpoint_job_status(result: Any) -> None:
     """Render endpoint job status."""
     if isinstance(result, dict):
-        table = Table(title="Job Status")
-        table.add_column("Field", style="cyan")
-        table.add_column("Value")
+        table = _make_table("Job Status", _FIELD_VALUE_COLUMNS)
         for key, val in result.items():
             if key == "output" and isinstance(val, dict):
                 table.add_row("output", str(val)[:200])
@@ -367,9 +425,7 @@ def print_endpoint_stream(chunks: list[Any]) -> None:
 def print_endpoint_purge_result(result: Any) -> None:
     """Render purge queue result."""
     if isinstance(result, dict):
-        table = Table(title="Purge Queue Result")
-        table.add_column("Field", style="cyan")
-        table.add_column("Value")
+        table = _make_table("Purge Queue Result", _FIELD_VALUE_COLUMNS)
         for key, val in result.items():
             table.add_row(str(key), str(val))
         console.print(table)
@@ -386,12 +442,7 @@ def print_volume_list(volumes: list[Any]) -> None:
         console.print("[dim]No network volumes found.[/dim]")
         return
 
-    table = Table(title="Network Volumes")
-    table.add_column("ID", style="cyan", no_wrap=True)
-    table.add_column("Name")
-    table.add_column("Size", justify="right")
-    table.add_column("Used", justify="right")
-    table.add_column("Datacenter")
+    table = _make_table("Network Volumes", _VOLUME_LIST_COLUMNS)
 
     for vol in volumes:
         used = f"{vol.used_size_gb:.1f} GB" if vol.used_size_gb else "-"
@@ -421,11 +472,7 @@ def print_template_list(templates: list[Any]) -> None:
         console.print("[dim]No templates found.[/dim]")
         return
 
-    table = Table(title="Templates")
-    table.add_column("ID", style="cyan", no_wrap=True)
-    table.add_column("Name")
-    table.add_column("Image")
-    table.add_column("Type", justify="center")
+    table = _make_table("Templates", _TEMPLATE_LIST_COLUMNS)
 
     for tmpl in templates:
         tmpl_type = "Serverless" if tmpl.is_serverless else "Pod"
@@ -454,12 +501,7 @@ def print_preset_list(presets: list[Any]) -> None:
         console.print("[dim]No presets found.[/dim]")
         return
 
-    table = Table(title="Presets")
-    table.add_column("Name", style="cyan", no_wrap=True)
-    table.add_column("Type", justify="center")
-    table.add_column("Description")
-    table.add_column("Key Params")
-    table.add_column("Created")
+    table = _make_table("Presets", _PRESET_LIST_COLUMNS)
 
     for p in presets:
         params = p.params
@@ -506,9 +548,7 @@ def print_dry_run(params: Any) -> None:
 def print_user_info(data: Any) -> None:
     """Render user account info."""
     if isinstance(data, dict):
-        table = Table(title="Account Info")
-        table.add_column("Field", style="cyan")
-        table.add_column("Value")
+        table = _make_table("Account Info", _FIELD_VALUE_COLUMNS)
 
         if "id" in data:
             table.add_row("ID", str(data["id"]))
@@ -544,9 +584,7 @@ def print_registry_list(registries: list[Any]) -> None:
         console.print("[dim]No container registry credentials found.[/dim]")
         return
 
-    table = Table(title="Container Registry Credentials")
-    table.add_column("ID", style="cyan", no_wrap=True)
-    table.add_column("Name")
+    table = _make_table("Container Registry Credentials", _REGISTRY_LIST_COLUMNS)
 
     for reg in registries:
         if isinstance(reg, dict):
@@ -562,9 +600,7 @@ def print_registry_list(registries: list[Any]) -> None:
 def print_registry_detail(data: Any) -> None:
     """Render registry auth detail."""
     if isinstance(data, dict):
-        table = Table(title="Registry Auth")
-        table.add_column("Field", style="cyan")
-        table.add_column("Value")
+        table = _make_table("Registry Auth", _FIELD_VALUE_COLUMNS)
         for key, val in data.items():
             if key != "password":  # Never display passwords
                 table.add_row(str(key), str(val))
@@ -5,22 +5,34 @@ from __future__ import annotations
 import sys
 from typing import Any
 
-import yaml
 from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 
 
 def print_yaml(data: Any) -> None:
     """Print data as YAML to stdout."""
+    import yaml  # deferred: only needed for --output yaml
+
     serialized: Any
     if isinstance(data, list):
-        serialized = [
-            item.model_dump(exclude_none=True) if isinstance(item, BaseModel) else item
-            for item in data
-        ]
-    elif isinstance(data, BaseModel):
-        serialized = data.model_dump(exclude_none=True)
-    elif isinstance(data, dict):
-        serialized = data
+        serialized = [_to_plain(item) for item in data]
+    elif isinstance(data, (BaseModel, dict)):
+        serialized = _to_plain(data)
     else:
         serialized = {"value": str(data)}
-    yaml.dump(serialized, sys.stdout, default_flow_style=False, sort_keys=False)
+    # Everything is reduced to JSON-compatible primitives, so the safe
+    # (libyaml-backed when available) dumper needs no Python-object representers.
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    text = yaml.dump(serialized, Dumper=dumper, default_flow_style=False, sort_keys=False)
+    sys.stdout.write(text)
+
+
+def _to_plain(item: Any) -> Any:
+    """Reduce *item* to JSON-compatible primitives the safe dumper can emit.
+
+    Models are dumped in JSON mode; pass-through data (datetimes, paths, enums,
+    tuples, ...) gets the same coercion, with ``str`` for anything else.
+    """
+    if isinstance(item, BaseModel):
+        return item.model_dump(mode="json", exclude_none=True)
+    return to_jsonable_python(item, fallback=str)
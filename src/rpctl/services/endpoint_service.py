@@ -17,7 +17,7 @@ class EndpointService:
     def list_endpoints(self) -> list[Endpoint]:
         """List all serverless endpoints."""
         raw = self._client.get_endpoints()
-        return [Endpoint.from_api(e) for e in raw]
+        return Endpoint.from_api_list(raw)
 
     def get_endpoint(self, endpoint_id: str) -> Endpoint:
         """Get a single endpoint by ID."""
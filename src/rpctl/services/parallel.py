@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, TypeVar
 
 T = TypeVar("T")
@@ -58,6 +59,16 @@ def parallel_map(
     result = BatchResult()
 
     with ThreadPoolExecutor(max_workers=workers) as executor:
+        if not stop_on_error:
+            # Collect every outcome; map() avoids per-future bookkeeping.
+            outcomes = executor.map(partial(_capture, func), items)
+            for item, (ok, value) in zip(items, outcomes, strict=True):
+                if ok:
+                    result.succeeded.append(value)
+                else:
+                    result.failed.append((item, value))
+            return result
+
         future_to_item = {executor.submit(func, item): item for item in items}
 
         for future in as_completed(future_to_item):
@@ -67,10 +78,17 @@ def parallel_map(
                 result.succeeded.append(value)
             except Exception as exc:
                 result.failed.append((item, exc))
-                if stop_on_error:
-                    # Cancel remaining futures
-                    for f in future_to_item:
-                        f.cancel()
-                    raise StopOnError(f"Stopped on error processing {item}: {exc}") from exc
+                # Cancel remaining futures
+                for f in future_to_item:
+                    f.cancel()
+                raise StopOnError(f"Stopped on error processing {item}: {exc}") from exc
 
     return result
+
+
+def _capture(func: Callable[[Any], Any], item: Any) -> tuple[bool, Any]:
+    """Run func(item), returning (ok, value-or-exception) instead of raising."""
+    try:
+        return True, func(item)
+    except Exception as exc:
+        return False, exc
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rpctl.api.rest_client import RestClient
 from rpctl.models.pod import Pod, PodCreateParams
 
+if TYPE_CHECKING:
+    from rpctl.services.parallel import BatchResult
+
 
 class PodService:
     """Manage RunPod GPU/CPU pods."""
@@ -17,7 +20,7 @@ class PodService:
     def list_pods(self, status_filter: str | None = None) -> list[Pod]:
         """List all pods, optionally filtered by status."""
         raw = self._client.get_pods()
-        pods = [Pod.from_api(p) for p in raw]
+        pods = Pod.from_api_list(raw)
         if status_filter and status_filter != "all":
             pods = [p for p in pods if p.status.lower() == status_filter.lower()]
         return pods
@@ -49,6 +52,18 @@ class PodService:
         """Terminate and delete a pod."""
         return self._client.terminate_pod(pod_id)
 
+    def stop_pods(self, pod_ids: list[str], *, max_workers: int = 5) -> BatchResult:
+        """Stop several pods concurrently, collecting per-pod failures."""
+        from rpctl.services.parallel import parallel_map
+
+        return parallel_map(self.stop_pod, pod_ids, max_workers=max_workers)
+
+    def delete_pods(self, pod_ids: list[str], *, max_workers: int = 5) -> BatchResult:
+        """Terminate several pods concurrently, collecting per-pod failures."""
+        from rpctl.services.parallel import parallel_map
+
+        return parallel_map(self.delete_pod, pod_ids, max_workers=max_workers)
+
     def wait_until_running(
         self,
         pod_id: str,
@@ -6,8 +6,6 @@ import re
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from rpctl.config.constants import PRESETS_DIR_NAME
 from rpctl.config.settings import get_config_dir
 from rpctl.errors import PresetError
@@ -48,6 +46,8 @@ class PresetService:
             msg = f"Preset '{preset.metadata.name}' already exists. Use --overwrite to replace it."
             raise PresetError(msg)
 
+        import yaml  # deferred: keeps `rpctl --help` from loading PyYAML
+
         self._dir.mkdir(parents=True, exist_ok=True)
         data = preset.model_dump(exclude_none=True)
         path.write_text(yaml.safe_dump(data, default_flow_style=False, sort_keys=False))
@@ -60,6 +60,8 @@ class PresetService:
         if not path.is_file():
             raise PresetError(f"Preset '{name}' not found.")
 
+        import yaml
+
         raw = yaml.safe_load(path.read_text())
         return Preset(**raw)
 
@@ -68,6 +70,8 @@ class PresetService:
         if not self._dir.is_dir():
             return []
 
+        import yaml
+
         presets: list[Preset] = []
         for path in sorted(self._dir.glob("*.yaml")):
             try:
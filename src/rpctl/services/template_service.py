@@ -17,7 +17,7 @@ class TemplateService:
     def list_templates(self) -> list[Template]:
         """List all templates."""
         raw = self._client.get_templates()
-        return [Template.from_api(t) for t in raw]
+        return Template.from_api_list(raw)
 
     def get_template(self, template_id: str) -> Template:
         """Get a single template by ID."""
@@ -17,7 +17,7 @@ class VolumeService:
     def list_volumes(self) -> list[Volume]:
         """List all network volumes."""
         raw = self._client.get_volumes()
-        return [Volume.from_api(v) for v in raw]
+        return Volume.from_api_list(raw)
 
     def get_volume(self, volume_id: str) -> Volume:
         """Get a single volume by ID."""
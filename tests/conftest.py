@@ -4,24 +4,72 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
+from tests.helpers.fakes import FakeClock, FakePodService
+
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
 @pytest.fixture
+def fake_clock(monkeypatch):
+    """Drive ``rpctl.services.poll`` with a FakeClock so waits never really sleep."""
+    clock = FakeClock()
+    monkeypatch.setattr("rpctl.services.poll.time", clock)
+    return clock
+
+
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Record retry backoff sleeps (in ``.sleeps``) instead of sleeping."""
+    clock = FakeClock()
+    monkeypatch.setattr("rpctl.api.retry.time", clock)
+    return clock
+
+
+@pytest.fixture(scope="session")
 def gpu_types_response():
-    """Sample GraphQL gpuTypes response."""
+    """Sample GraphQL gpuTypes response (shared read-only across the session)."""
     return json.loads((FIXTURES / "gpu_types.json").read_text())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def datacenter_response():
-    """Sample GraphQL datacenter availability response."""
+    """Sample GraphQL datacenter availability response (shared read-only across the session)."""
     return json.loads((FIXTURES / "datacenters.json").read_text())
 
 
+@pytest.fixture
+def cli_ctx():
+    """Stand-in for the typer.Context populated by the root callback.
+
+    Lets CLI tests call command functions directly instead of going through
+    ``CliRunner.invoke``. Set ``cli_ctx.obj["output_format"]`` to switch formats.
+    """
+    return SimpleNamespace(
+        obj={"profile": None, "output_format": "table", "json": False, "verbose": False}
+    )
+
+
+@pytest.fixture
+def fake_pod_service(monkeypatch):
+    """FakePodService returned by ``rpctl.cli.pod._get_pod_service``."""
+    svc = FakePodService()
+    monkeypatch.setattr("rpctl.cli.pod._get_pod_service", lambda _ctx: svc)
+    return svc
+
+
+@pytest.fixture
+def mock_registry_service(monkeypatch):
+    """MagicMock returned by ``rpctl.cli.registry._get_registry_service``."""
+    svc = MagicMock()
+    monkeypatch.setattr("rpctl.cli.registry._get_registry_service", lambda _ctx: svc)
+    return svc
+
+
 @pytest.fixture
 def tmp_config(tmp_path):
     """Create a temporary config directory and file."""
@@ -0,0 +1,41 @@
+"""Shared CliRunner for CLI tests.
+
+``typer.testing.CliRunner.invoke`` rebuilds the whole Click command tree on
+every call, which costs more than most invocations themselves. The runner here
+builds it once per app with :func:`get_command` and reuses it, so every CLI
+test shares one command tree per app. Commands must therefore not be mutated
+by tests.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+import pytest
+import typer
+import typer.main
+import typer.testing
+
+
+@functools.cache
+def get_command(app: typer.Typer) -> Any:
+    """Return the Click command for *app*, built once per process."""
+    return typer.main.get_command(app)
+
+
+class CliRunner(typer.testing.CliRunner):
+    """CliRunner that invokes the cached :func:`get_command` tree.
+
+    Typer's ``invoke`` looks the command up through the private
+    ``typer.testing._get_command`` alias; ``test_cli_runner.py`` checks the
+    alias still exists so a Typer upgrade that drops it fails there.
+    """
+
+    def invoke(self, app: typer.Typer, *args: Any, **kwargs: Any) -> typer.testing.Result:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(typer.testing, "_get_command", get_command)
+            return super().invoke(app, *args, **kwargs)
+
+
+runner = CliRunner()
@@ -0,0 +1,38 @@
+"""Shared checks for service methods that delegate to a single client call."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from tests.helpers.fakes import RecordingClient
+
+
+def call_service(
+    svc_cls: type, svc_method: str, client_method: str, ret: Any, *args: Any, **kwargs: Any
+) -> tuple[Any, RecordingClient]:
+    """Call ``svc_cls(client).<svc_method>(*args, **kwargs)`` on a RecordingClient.
+
+    The client answers *client_method* with *ret*. Returns ``(result, client)``.
+    """
+    client = RecordingClient({client_method: ret})
+    result = getattr(svc_cls(client), svc_method)(*args, **kwargs)
+    return result, client
+
+
+def assert_delegates(
+    svc_cls: type,
+    svc_method: str,
+    client_method: str,
+    args: tuple[Any, ...],
+    *,
+    kwargs: dict[str, Any] | None = None,
+    client_args: tuple[Any, ...] | None = None,
+    ret: Any = None,
+) -> None:
+    """Assert *svc_method* makes one *client_method* call and returns its result as-is.
+
+    *client_args* defaults to *args*, for methods that forward their arguments unchanged.
+    """
+    result, client = call_service(svc_cls, svc_method, client_method, ret, *args, **(kwargs or {}))
+    assert result == ret
+    assert client.calls == [(client_method, args if client_args is None else client_args)]
@@ -0,0 +1,99 @@
+"""Test doubles shared across the test suite."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from rpctl.services.parallel import BatchResult
+
+
+class RecordingClient:
+    """Minimal fake API client for service delegation tests.
+
+    Any method named in *returns* can be called; each call is appended to
+    ``calls`` as ``(name, args)`` (plus ``kwargs`` when given) and returns
+    the canned value.
+    """
+
+    __slots__ = ("_returns", "calls")
+
+    def __init__(self, returns: dict[str, Any]) -> None:
+        self._returns = returns
+        self.calls: list[tuple[Any, ...]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            ret = self._returns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            self.calls.append((name, args, kwargs) if kwargs else (name, args))
+            return ret
+
+        return method
+
+
+class FakePodService:
+    """Scripted stand-in for PodService in CLI tests.
+
+    ``list_pods`` returns ``pods`` (or raises ``list_error``). Each ``stop_pod``/
+    ``delete_pod`` call records the pod ID and pops its outcome from
+    ``stop_results``/``delete_results``: exceptions are raised, other values
+    returned, and ``{}`` is used once the queue is empty. The bulk calls record
+    ``(name, pod_ids, kwargs)`` in ``bulk_calls`` and return ``bulk_result``.
+    """
+
+    def __init__(self) -> None:
+        self.pods: list[Any] = []
+        self.list_error: Exception | None = None
+        self.stop_results: deque[Any] = deque()
+        self.delete_results: deque[Any] = deque()
+        self.stopped: list[str] = []
+        self.deleted: list[str] = []
+        self.bulk_calls: list[tuple[str, list[str], dict[str, Any]]] = []
+        self.bulk_result = BatchResult()
+
+    def list_pods(self, status_filter: str | None = None) -> list[Any]:
+        if self.list_error is not None:
+            raise self.list_error
+        return self.pods
+
+    def stop_pod(self, pod_id: str) -> Any:
+        self.stopped.append(pod_id)
+        return _next_outcome(self.stop_results)
+
+    def delete_pod(self, pod_id: str) -> Any:
+        self.deleted.append(pod_id)
+        return _next_outcome(self.delete_results)
+
+    def stop_pods(self, pod_ids: list[str], **kwargs: Any) -> BatchResult:
+        self.bulk_calls.append(("stop_pods", pod_ids, kwargs))
+        return self.bulk_result
+
+    def delete_pods(self, pod_ids: list[str], **kwargs: Any) -> BatchResult:
+        self.bulk_calls.append(("delete_pods", pod_ids, kwargs))
+        return self.bulk_result
+
+
+def _next_outcome(results: deque[Any]) -> Any:
+    outcome = results.popleft() if results else {}
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
+
+class FakeClock:
+    """Stand-in for the ``time`` module in polling code; ``sleep`` advances ``now``."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
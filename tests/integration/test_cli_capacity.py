@@ -6,7 +6,6 @@ import json
 from unittest.mock import MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
 
 from rpctl.main import app
 from rpctl.models.capacity import (
@@ -17,8 +16,7 @@ from rpctl.models.capacity import (
     GpuStock,
     GpuType,
 )
-
-runner = CliRunner()
+from tests.helpers.cli import runner
 
 
 @pytest.fixture
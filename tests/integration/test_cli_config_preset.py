@@ -6,14 +6,11 @@ from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
-
 from rpctl.errors import ApiError, ConfigError, PresetError
 from rpctl.main import app
 from rpctl.models.endpoint import Endpoint
 from rpctl.models.pod import Pod
-
-runner = CliRunner()
+from tests.helpers.cli import runner
 
 
 def _mock_settings():
@@ -7,7 +7,6 @@ from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
 
 from rpctl.errors import ApiError
 from rpctl.main import app
@@ -15,8 +14,7 @@ from rpctl.models.endpoint import Endpoint
 from rpctl.models.pod import Pod
 from rpctl.models.template import Template
 from rpctl.models.volume import Volume
-
-runner = CliRunner()
+from tests.helpers.cli import runner
 
 
 def _mock_settings():
@@ -2,11 +2,8 @@
 
 from __future__ import annotations
 
-from typer.testing import CliRunner
-
 from rpctl.main import app
-
-runner = CliRunner()
+from tests.helpers.cli import runner
 
 
 def test_help():
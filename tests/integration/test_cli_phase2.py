@@ -6,15 +6,13 @@ import json
 from unittest.mock import MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
 
 from rpctl.main import app
 from rpctl.models.endpoint import Endpoint
 from rpctl.models.pod import Pod
 from rpctl.models.template import Template
 from rpctl.models.volume import Volume
-
-runner = CliRunner()
+from tests.helpers.cli import runner
 
 
 def _mock_settings():
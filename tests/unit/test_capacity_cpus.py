@@ -4,12 +4,11 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
-
+from rpctl.errors import ApiError
+from rpctl.main import app
 from rpctl.models.capacity import CpuType
 from rpctl.services.capacity_service import CapacityService
-
-runner = CliRunner()
+from tests.helpers.cli import runner
 
 
 class TestCapacityServiceCpus:
@@ -54,8 +53,6 @@ class TestCapacityServiceCpus:
 class TestCapacityCpusCLI:
     @patch("rpctl.cli.capacity._get_capacity_service")
     def test_cpus_table(self, mock_svc_fn):
-        from rpctl.main import app
-
         mock_svc = MagicMock()
         mock_svc.list_cpu_types.return_value = [
             CpuType(
@@ -72,8 +69,6 @@ class TestCapacityCpusCLI:
 
     @patch("rpctl.cli.capacity._get_capacity_service")
     def test_cpus_json(self, mock_svc_fn):
-        from rpctl.main import app
-
         mock_svc = MagicMock()
         mock_svc.list_cpu_types.return_value = [
             CpuType(id="cpu-1", display_name="AMD EPYC 7B13"),
@@ -84,8 +79,6 @@ class TestCapacityCpusCLI:
 
     @patch("rpctl.cli.capacity._get_capacity_service")
     def test_cpus_empty(self, mock_svc_fn):
-        from rpctl.main import app
-
         mock_svc = MagicMock()
         mock_svc.list_cpu_types.return_value = []
         mock_svc_fn.return_value = mock_svc
@@ -95,9 +88,6 @@ class TestCapacityCpusCLI:
 
     @patch("rpctl.cli.capacity._get_capacity_service")
     def test_cpus_error(self, mock_svc_fn):
-        from rpctl.errors import ApiError
-        from rpctl.main import app
-
         mock_svc = MagicMock()
         mock_svc.list_cpu_types.side_effect = ApiError("Network error")
         mock_svc_fn.return_value = mock_svc
@@ -0,0 +1,21 @@
+"""Tests for the shared CLI test runner."""
+
+from __future__ import annotations
+
+import typer.testing
+
+from rpctl.main import app
+from tests.helpers.cli import get_command, runner
+
+
+def test_typer_get_command_alias_exists():
+    """The runner swaps ``typer.testing._get_command``; fail here if Typer drops it."""
+    assert callable(typer.testing._get_command)
+
+
+def test_runner_reuses_one_command_tree():
+    """Every invoke goes through the same cached Click command for an app."""
+    assert get_command(app) is get_command(app)
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert typer.testing._get_command is not get_command
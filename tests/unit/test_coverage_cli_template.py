@@ -4,12 +4,9 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
-
 from rpctl.main import app
 from rpctl.models.template import Template
-
-runner = CliRunner()
+from tests.helpers.cli import runner
 
 
 def _mock_template():
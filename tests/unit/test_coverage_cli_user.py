@@ -4,12 +4,9 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
-
 from rpctl.errors import RpctlError
 from rpctl.main import app
-
-runner = CliRunner()
+from tests.helpers.cli import runner
 
 
 def test_set_ssh_key_default_key_found():
@@ -8,8 +8,10 @@ from unittest.mock import MagicMock, patch
 import yaml
 
 from rpctl.errors import AuthenticationError, ResourceNotFoundError
+from rpctl.main import app
 from rpctl.models.endpoint import EndpointCreateParams
 from rpctl.models.pod import PodCreateParams
+from tests.helpers.cli import runner
 
 # --- errors.py: is_transient properties ---
 
@@ -215,11 +217,6 @@ def test_preset_list_skips_malformed(tmp_path):
 
 
 def test_main_no_subcommand():
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     # With no_args_is_help=True, typer shows help and exits
     result = runner.invoke(app, [])
     assert "rpctl" in result.output or result.exit_code == 0
@@ -227,22 +224,12 @@ def test_main_no_subcommand():
 
 def test_main_verbose_no_subcommand():
     """Verbose flag with no subcommand still prints help."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     result = runner.invoke(app, ["--verbose"])
     # Should get help output or exit cleanly
     assert result.exit_code == 0 or "rpctl" in result.output
 
 
 def test_main_version():
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     result = runner.invoke(app, ["--version"])
     assert result.exit_code == 0
     assert "rpctl" in result.output
@@ -264,11 +251,6 @@ def test_get_preset_service_default():
 
 def test_preset_delete_prompt_abort():
     """preset delete aborts on 'n' input."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     mock_svc = MagicMock()
     with patch("rpctl.cli.preset._get_preset_service", return_value=mock_svc):
         result = runner.invoke(app, ["preset", "delete", "test"], input="n\n")
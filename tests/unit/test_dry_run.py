@@ -4,11 +4,8 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
-
 from rpctl.main import app
-
-runner = CliRunner()
+from tests.helpers.cli import runner
 
 
 def test_pod_create_dry_run():
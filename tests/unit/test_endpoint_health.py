@@ -2,103 +2,75 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
+import typer
 
+from rpctl.cli import endpoint as endpoint_cli
 from rpctl.errors import RpctlError
+from rpctl.main import app
+from rpctl.models.endpoint import Endpoint, EndpointCreateParams
+from rpctl.services.endpoint_service import EndpointService
 from rpctl.services.poll import PollTimeoutError
-
-# --- EndpointService.health() ---
-
-
-def test_endpoint_service_health():
-    """health() delegates to client.endpoint_health()."""
-    from rpctl.services.endpoint_service import EndpointService
-
-    mock_client = MagicMock()
-    mock_client.endpoint_health.return_value = {
-        "workers": {"ready": 2, "idle": 1, "running": 1},
-        "jobs": {"completed": 100, "failed": 5},
-    }
-    svc = EndpointService(mock_client)
-    result = svc.health("ep-123")
-    assert result["workers"]["ready"] == 2
-    mock_client.endpoint_health.assert_called_once_with("ep-123")
-
+from tests.helpers.cli import runner
 
 # --- EndpointService.wait_until_ready() ---
 
 
-def test_endpoint_service_wait_until_ready():
+def test_endpoint_service_wait_until_ready(fake_clock):
     """wait_until_ready returns when workers are ready."""
-    from rpctl.services.endpoint_service import EndpointService
-
-    mock_client = MagicMock()
+    mock_client = Mock(spec=["endpoint_health"])
     # First call: no workers, second call: workers ready
     mock_client.endpoint_health.side_effect = [
         {"workers": {"ready": 0, "idle": 0}, "jobs": {}},
         {"workers": {"ready": 1, "idle": 0}, "jobs": {}},
     ]
     svc = EndpointService(mock_client)
-    result = svc.wait_until_ready("ep-123", timeout=10, interval=0.01)
+    result = svc.wait_until_ready("ep-123", timeout=10, interval=1)
     assert result["workers"]["ready"] == 1
     assert mock_client.endpoint_health.call_count == 2
 
 
-def test_endpoint_service_wait_timeout():
+def test_endpoint_service_wait_timeout(fake_clock):
     """wait_until_ready raises PollTimeoutError on timeout."""
-    from rpctl.services.endpoint_service import EndpointService
-
-    mock_client = MagicMock()
-    mock_client.endpoint_health.return_value = {
-        "workers": {"ready": 0, "idle": 0},
-        "jobs": {},
-    }
+    mock_client = SimpleNamespace(
+        endpoint_health=lambda _eid: {"workers": {"ready": 0, "idle": 0}, "jobs": {}},
+    )
     svc = EndpointService(mock_client)
     with pytest.raises(PollTimeoutError):
-        svc.wait_until_ready("ep-123", timeout=0.05, interval=0.01)
+        svc.wait_until_ready("ep-123", timeout=10, interval=5)
 
 
 # --- CLI: rpctl endpoint health ---
 
 
-def test_cli_endpoint_health():
+def test_cli_endpoint_health(cli_ctx):
     """rpctl endpoint health EP_ID returns health data."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     mock_health = {
         "workers": {"ready": 2, "idle": 1},
         "jobs": {"completed": 50},
     }
 
     with patch("rpctl.cli.endpoint._get_endpoint_service") as mock_svc_fn:
-        mock_svc = MagicMock()
+        mock_svc = Mock(spec=EndpointService)
         mock_svc.health.return_value = mock_health
         mock_svc_fn.return_value = mock_svc
 
-        result = runner.invoke(app, ["endpoint", "health", "ep-abc"])
-        assert result.exit_code == 0
+        endpoint_cli.health(cli_ctx, "ep-abc")
         mock_svc.health.assert_called_once_with("ep-abc")
 
 
 def test_cli_endpoint_health_json():
     """rpctl endpoint health EP_ID --output json outputs JSON."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     mock_health = {
         "workers": {"ready": 1, "idle": 0},
         "jobs": {"completed": 10},
     }
 
     with patch("rpctl.cli.endpoint._get_endpoint_service") as mock_svc_fn:
-        mock_svc = MagicMock()
+        mock_svc = Mock(spec=EndpointService)
         mock_svc.health.return_value = mock_health
         mock_svc_fn.return_value = mock_svc
 
@@ -107,21 +79,16 @@ def test_cli_endpoint_health_json():
         assert "ready" in result.output
 
 
-def test_cli_endpoint_health_api_error():
+def test_cli_endpoint_health_api_error(cli_ctx):
     """rpctl endpoint health handles API errors."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
     with patch("rpctl.cli.endpoint._get_endpoint_service") as mock_svc_fn:
-        mock_svc = MagicMock()
+        mock_svc = Mock(spec=EndpointService)
         mock_svc.health.side_effect = RpctlError("Not found")
         mock_svc_fn.return_value = mock_svc
 
-        result = runner.invoke(app, ["endpoint", "health", "ep-bad"])
-        assert result.exit_code == 1
+        with pytest.raises(typer.Exit) as exc_info:
+            endpoint_cli.health(cli_ctx, "ep-bad")
+        assert exc_info.value.exit_code == 1
 
 
 # --- CLI: rpctl endpoint wait ---
@@ -129,18 +96,13 @@ def test_cli_endpoint_health_api_error():
 
 def test_cli_endpoint_wait_success():
     """rpctl endpoint wait EP_ID succeeds when workers ready."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     mock_health = {
         "workers": {"ready": 1, "idle": 0},
         "jobs": {},
     }
 
     with patch("rpctl.cli.endpoint._get_endpoint_service") as mock_svc_fn:
-        mock_svc = MagicMock()
+        mock_svc = Mock(spec=EndpointService)
         mock_svc.wait_until_ready.return_value = mock_health
         mock_svc_fn.return_value = mock_svc
 
@@ -151,38 +113,28 @@ def test_cli_endpoint_wait_success():
         mock_svc.wait_until_ready.assert_called_once_with("ep-abc", timeout=60, interval=1)
 
 
-def test_cli_endpoint_wait_timeout():
+def test_cli_endpoint_wait_timeout(cli_ctx):
     """rpctl endpoint wait exits 2 on timeout."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
     with patch("rpctl.cli.endpoint._get_endpoint_service") as mock_svc_fn:
-        mock_svc = MagicMock()
+        mock_svc = Mock(spec=EndpointService)
         mock_svc.wait_until_ready.side_effect = PollTimeoutError("timed out")
         mock_svc_fn.return_value = mock_svc
 
-        result = runner.invoke(app, ["endpoint", "wait", "ep-abc"])
-        assert result.exit_code == 2
+        with pytest.raises(typer.Exit) as exc_info:
+            endpoint_cli.wait(cli_ctx, "ep-abc", timeout=300, interval=5)
+        assert exc_info.value.exit_code == 2
 
 
-def test_cli_endpoint_wait_api_error():
+def test_cli_endpoint_wait_api_error(cli_ctx):
     """rpctl endpoint wait exits 1 on API error."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
     with patch("rpctl.cli.endpoint._get_endpoint_service") as mock_svc_fn:
-        mock_svc = MagicMock()
+        mock_svc = Mock(spec=EndpointService)
         mock_svc.wait_until_ready.side_effect = RpctlError("API error")
         mock_svc_fn.return_value = mock_svc
 
-        result = runner.invoke(app, ["endpoint", "wait", "ep-abc"])
-        assert result.exit_code == 1
+        with pytest.raises(typer.Exit) as exc_info:
+            endpoint_cli.wait(cli_ctx, "ep-abc", timeout=300, interval=5)
+        assert exc_info.value.exit_code == 1
 
 
 # --- EndpointCreateParams.to_sdk_kwargs() with cuda_versions ---
@@ -190,8 +142,6 @@ def test_cli_endpoint_wait_api_error():
 
 def test_endpoint_create_params_cuda_versions():
     """allowed_cuda_versions is joined and passed to SDK kwargs."""
-    from rpctl.models.endpoint import EndpointCreateParams
-
     params = EndpointCreateParams(
         name="test-ep",
         template_id="tmpl-123",
@@ -203,8 +153,6 @@ def test_endpoint_create_params_cuda_versions():
 
 def test_endpoint_create_params_no_cuda_versions():
     """allowed_cuda_versions is not included when None."""
-    from rpctl.models.endpoint import EndpointCreateParams
-
     params = EndpointCreateParams(name="test-ep", template_id="tmpl-123")
     kwargs = params.to_sdk_kwargs()
     assert "allowed_cuda_versions" not in kwargs
@@ -215,15 +163,8 @@ def test_endpoint_create_params_no_cuda_versions():
 
 def test_cli_endpoint_create_cuda_version():
     """--cuda-version is passed through to endpoint create."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-    from rpctl.models.endpoint import Endpoint
-
-    runner = CliRunner()
-
     with patch("rpctl.cli.endpoint._get_endpoint_service") as mock_svc_fn:
-        mock_svc = MagicMock()
+        mock_svc = Mock(spec=EndpointService)
         mock_svc.create_endpoint.return_value = Endpoint(id="ep-new", name="test-ep")
         mock_svc_fn.return_value = mock_svc
 
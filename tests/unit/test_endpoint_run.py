@@ -1,54 +1,78 @@
-"""Tests for endpoint run and purge-queue commands."""
+"""Tests for endpoint run and purge-queue commands and service delegation."""
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
-
-from rpctl.errors import RpctlError
-
-# --- EndpointService.run_sync() ---
-
-
-def test_endpoint_service_run_sync():
-    """run_sync() delegates to client.endpoint_run_sync()."""
-    from rpctl.services.endpoint_service import EndpointService
-
-    mock_client = MagicMock()
-    mock_client.endpoint_run_sync.return_value = {"output": "hello", "status": "COMPLETED"}
-    svc = EndpointService(mock_client)
-    result = svc.run_sync("ep-123", {"prompt": "test"}, timeout=60)
-    assert result["status"] == "COMPLETED"
-    mock_client.endpoint_run_sync.assert_called_once_with("ep-123", {"prompt": "test"}, 60)
-
-
-# --- EndpointService.run_async() ---
+from unittest.mock import Mock, patch
 
+import pytest
+import typer
 
-def test_endpoint_service_run_async():
-    """run_async() delegates to client.endpoint_run_async(), returns job_id."""
-    from rpctl.services.endpoint_service import EndpointService
-
-    mock_client = MagicMock()
-    mock_client.endpoint_run_async.return_value = "job-abc-123"
-    svc = EndpointService(mock_client)
-    job_id = svc.run_async("ep-123", {"prompt": "test"})
-    assert job_id == "job-abc-123"
-    mock_client.endpoint_run_async.assert_called_once_with("ep-123", {"prompt": "test"})
-
-
-# --- EndpointService.purge_queue() ---
-
-
-def test_endpoint_service_purge_queue():
-    """purge_queue() delegates to client.endpoint_purge_queue()."""
-    from rpctl.services.endpoint_service import EndpointService
-
-    mock_client = MagicMock()
-    mock_client.endpoint_purge_queue.return_value = {"status": "completed", "removed": 5}
-    svc = EndpointService(mock_client)
-    result = svc.purge_queue("ep-123")
-    assert result["removed"] == 5
-    mock_client.endpoint_purge_queue.assert_called_once_with("ep-123")
+from rpctl.cli import endpoint as endpoint_cli
+from rpctl.errors import RpctlError
+from rpctl.main import app
+from rpctl.services.endpoint_service import EndpointService
+from tests.helpers.cli import runner
+from tests.helpers.delegation import assert_delegates
+
+# --- EndpointService delegation ---
+
+
+@pytest.mark.parametrize(
+    ("svc_method", "client_method", "args", "kwargs", "client_args", "ret"),
+    [
+        (
+            "health",
+            "endpoint_health",
+            ("ep-123",),
+            {},
+            ("ep-123",),
+            {"workers": {"ready": 2, "idle": 1, "running": 1}, "jobs": {"completed": 100}},
+        ),
+        (
+            "run_sync",
+            "endpoint_run_sync",
+            ("ep-123", {"prompt": "test"}),
+            {"timeout": 60},
+            ("ep-123", {"prompt": "test"}, 60),
+            {"output": "hello", "status": "COMPLETED"},
+        ),
+        (
+            "run_async",
+            "endpoint_run_async",
+            ("ep-123", {"prompt": "test"}),
+            {},
+            ("ep-123", {"prompt": "test"}),
+            "job-abc-123",
+        ),
+        (
+            "purge_queue",
+            "endpoint_purge_queue",
+            ("ep-123",),
+            {},
+            ("ep-123",),
+            {"status": "completed", "removed": 5},
+        ),
+        (
+            "stream",
+            "endpoint_stream",
+            ("ep-123", "job-456"),
+            {},
+            ("ep-123", "job-456"),
+            [{"output": "test"}],
+        ),
+    ],
+)
+def test_endpoint_service_delegates(svc_method, client_method, args, kwargs, client_args, ret):
+    """Pass-through EndpointService methods delegate to the matching client call."""
+    assert_delegates(
+        EndpointService,
+        svc_method,
+        client_method,
+        args,
+        kwargs=kwargs,
+        client_args=client_args,
+        ret=ret,
+    )
 
 
 # --- CLI: rpctl endpoint run (sync) ---
@@ -56,15 +80,10 @@ def test_endpoint_service_purge_queue():
 
 def test_cli_endpoint_run_sync():
     """rpctl endpoint run EP_ID runs sync by default."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     mock_result = {"output": "hello world", "status": "COMPLETED"}
 
     with patch("rpctl.cli.endpoint._get_endpoint_service") as mock_svc_fn:
-        mock_svc = MagicMock()
+        mock_svc = Mock(spec=EndpointService)
         mock_svc.run_sync.return_value = mock_result
         mock_svc_fn.return_value = mock_svc
 
@@ -78,14 +97,8 @@ def test_cli_endpoint_run_sync():
 
 def test_cli_endpoint_run_async():
     """rpctl endpoint run EP_ID --async submits async job."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
     with patch("rpctl.cli.endpoint._get_endpoint_service") as mock_svc_fn:
-        mock_svc = MagicMock()
+        mock_svc = Mock(spec=EndpointService)
         mock_svc.run_async.return_value = "job-xyz-789"
         mock_svc_fn.return_value = mock_svc
 
@@ -100,55 +113,39 @@ def test_cli_endpoint_run_async():
 # --- CLI: rpctl endpoint run (invalid JSON) ---
 
 
-def test_cli_endpoint_run_invalid_json():
+def test_cli_endpoint_run_invalid_json(cli_ctx):
     """rpctl endpoint run exits 1 on invalid JSON input."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
-    result = runner.invoke(app, ["endpoint", "run", "ep-abc", "--input", "not-valid-json"])
-    assert result.exit_code == 1
+    with pytest.raises(typer.Exit) as exc_info:
+        endpoint_cli.run(cli_ctx, "ep-abc", input_json="not-valid-json", sync=True, timeout=86400)
+    assert exc_info.value.exit_code == 1
 
 
 # --- CLI: rpctl endpoint purge-queue ---
 
 
-def test_cli_endpoint_purge_queue():
+def test_cli_endpoint_purge_queue(cli_ctx):
     """rpctl endpoint purge-queue EP_ID --confirm purges the queue."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     mock_result = {"status": "completed", "removed": 3}
 
     with patch("rpctl.cli.endpoint._get_endpoint_service") as mock_svc_fn:
-        mock_svc = MagicMock()
+        mock_svc = Mock(spec=EndpointService)
         mock_svc.purge_queue.return_value = mock_result
         mock_svc_fn.return_value = mock_svc
 
-        result = runner.invoke(app, ["endpoint", "purge-queue", "ep-abc", "--confirm"])
-        assert result.exit_code == 0
+        endpoint_cli.purge_queue(cli_ctx, "ep-abc", confirm=True)
         mock_svc.purge_queue.assert_called_once_with("ep-abc")
 
 
 # --- CLI: rpctl endpoint purge-queue (API error) ---
 
 
-def test_cli_endpoint_purge_queue_api_error():
+def test_cli_endpoint_purge_queue_api_error(cli_ctx):
     """rpctl endpoint purge-queue exits 1 on API error."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
     with patch("rpctl.cli.endpoint._get_endpoint_service") as mock_svc_fn:
-        mock_svc = MagicMock()
+        mock_svc = Mock(spec=EndpointService)
         mock_svc.purge_queue.side_effect = RpctlError("API error")
         mock_svc_fn.return_value = mock_svc
 
-        result = runner.invoke(app, ["endpoint", "purge-queue", "ep-abc", "--confirm"])
-        assert result.exit_code == 1
+        with pytest.raises(typer.Exit) as exc_info:
+            endpoint_cli.purge_queue(cli_ctx, "ep-abc", confirm=True)
+        assert exc_info.value.exit_code == 1
@@ -6,7 +6,6 @@ from unittest.mock import patch
 
 import httpx
 import pytest
-import respx
 
 from rpctl.api.graphql_client import GraphQLClient
 from rpctl.errors import ApiError, AuthenticationError
@@ -14,198 +13,156 @@ from rpctl.errors import ApiError, AuthenticationError
 GQL_URL = "https://api.runpod.io/graphql/"
 QUERY = "query { gpuTypes { id } }"
 
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Canned responses are built once; respx clones them per request.
+A100_GPU = httpx.Response(
+    200, content=b'{"data": {"gpuTypes": [{"id": "A100"}]}}', headers=JSON_HEADERS
+)
+POD_1 = httpx.Response(200, content=b'{"data": {"pod": {"id": "pod-1"}}}', headers=JSON_HEADERS)
+EMPTY_GPU = httpx.Response(200, content=b'{"data": {"gpuTypes": []}}', headers=JSON_HEADERS)
+OK_DATA = httpx.Response(200, content=b'{"data": {"ok": true}}', headers=JSON_HEADERS)
+FIELD_ERROR = httpx.Response(
+    200, content=b'{"errors": [{"message": "Field \'foo\' not found"}]}', headers=JSON_HEADERS
+)
+EMPTY_BODY = httpx.Response(200, content=b"{}", headers=JSON_HEADERS)
+UNAUTHORIZED = httpx.Response(401)
+RATE_LIMITED = httpx.Response(429, headers={"Retry-After": "1"})
+SERVER_ERROR = httpx.Response(500)
+
+
+@pytest.fixture(scope="module")
+def gql_client():
+    """Single GraphQLClient shared across the module's tests."""
+    with GraphQLClient("test-key") as client:
+        yield client
+
 
-@respx.mock
 @patch("rpctl.api.retry.time.sleep")
-def test_execute_success(mock_sleep):
+def test_execute_success(mock_sleep, respx_mock, gql_client):
     """Successful GraphQL response returns data."""
-    respx.post(GQL_URL).mock(
-        return_value=httpx.Response(200, json={"data": {"gpuTypes": [{"id": "A100"}]}})
-    )
-    client = GraphQLClient("test-key")
-    result = client.execute(QUERY)
+    respx_mock.post(GQL_URL).mock(return_value=A100_GPU)
+    result = gql_client.execute(QUERY)
     assert result == {"gpuTypes": [{"id": "A100"}]}
     mock_sleep.assert_not_called()
 
 
-@respx.mock
-@patch("rpctl.api.retry.time.sleep")
-def test_execute_with_variables(mock_sleep):
+def test_execute_with_variables(respx_mock, gql_client):
     """Query variables are included in the request payload."""
-    route = respx.post(GQL_URL).mock(
-        return_value=httpx.Response(200, json={"data": {"pod": {"id": "pod-1"}}})
-    )
-    client = GraphQLClient("test-key")
-    result = client.execute("query($id: String!) { pod(id: $id) { id } }", {"id": "pod-1"})
+    route = respx_mock.post(GQL_URL).mock(return_value=POD_1)
+    result = gql_client.execute("query($id: String!) { pod(id: $id) { id } }", {"id": "pod-1"})
     assert result == {"pod": {"id": "pod-1"}}
     payload = route.calls[0].request.content
     assert b"variables" in payload
 
 
-@respx.mock
 @patch("rpctl.api.retry.time.sleep")
-def test_execute_auth_error(mock_sleep):
+def test_execute_auth_error(mock_sleep, respx_mock):
     """401 response raises AuthenticationError (no retry)."""
-    respx.post(GQL_URL).mock(return_value=httpx.Response(401))
+    respx_mock.post(GQL_URL).mock(return_value=UNAUTHORIZED)
     client = GraphQLClient("bad-key")
     with pytest.raises(AuthenticationError, match="Invalid API key"):
         client.execute(QUERY)
     mock_sleep.assert_not_called()
 
 
-@respx.mock
+@pytest.mark.parametrize(
+    ("status", "transient", "n_sleeps", "match"),
+    [
+        (429, True, 2, "Rate limited"),
+        (500, True, 2, "status 500"),
+        (503, True, 2, "status 503"),
+        (400, False, 0, "status 400"),
+    ],
+)
 @patch("rpctl.api.retry.time.sleep")
-def test_execute_rate_limited_429(mock_sleep):
-    """429 response raises transient ApiError with status_code."""
-    respx.post(GQL_URL).mock(
-        side_effect=[
-            httpx.Response(429, headers={"Retry-After": "3"}),
-            httpx.Response(429, headers={"Retry-After": "3"}),
-            httpx.Response(429, headers={"Retry-After": "3"}),
-        ]
-    )
-    client = GraphQLClient("test-key")
+def test_execute_error_status(
+    mock_sleep, respx_mock, gql_client, status, transient, n_sleeps, match
+):
+    """Transient statuses are retried until exhausted; others raise immediately."""
+    respx_mock.post(GQL_URL).mock(return_value=httpx.Response(status))
+    with pytest.raises(ApiError, match=match) as exc_info:
+        gql_client.execute(QUERY)
+    assert exc_info.value.status_code == status
+    assert exc_info.value.is_transient is transient
+    assert mock_sleep.call_count == n_sleeps
+
+
+@patch("rpctl.api.retry.time.sleep")
+def test_execute_rate_limited_retry_after(mock_sleep, respx_mock, gql_client):
+    """A 429 Retry-After header sets the backoff delay for every retry."""
+    respx_mock.post(GQL_URL).mock(return_value=httpx.Response(429, headers={"Retry-After": "3"}))
     with pytest.raises(ApiError, match="Rate limited") as exc_info:
-        client.execute(QUERY)
+        gql_client.execute(QUERY)
     assert exc_info.value.status_code == 429
-    assert exc_info.value.is_transient
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [3.0, 3.0]
 
 
-@respx.mock
 @patch("rpctl.api.retry.time.sleep")
-def test_execute_429_then_success(mock_sleep):
+def test_execute_429_then_success(mock_sleep, respx_mock, gql_client):
     """429 followed by success should work via retry."""
-    respx.post(GQL_URL).mock(
-        side_effect=[
-            httpx.Response(429, headers={"Retry-After": "1"}),
-            httpx.Response(200, json={"data": {"gpuTypes": []}}),
-        ]
-    )
-    client = GraphQLClient("test-key")
-    result = client.execute(QUERY)
+    respx_mock.post(GQL_URL).mock(side_effect=[RATE_LIMITED, EMPTY_GPU])
+    result = gql_client.execute(QUERY)
     assert result == {"gpuTypes": []}
     assert mock_sleep.call_count == 1
 
 
-@respx.mock
 @patch("rpctl.api.retry.time.sleep")
-def test_execute_server_error_500(mock_sleep):
+def test_execute_server_error_500_then_success(mock_sleep, respx_mock, gql_client):
     """500 response is transient and retried."""
-    respx.post(GQL_URL).mock(
-        side_effect=[
-            httpx.Response(500),
-            httpx.Response(200, json={"data": {"ok": True}}),
-        ]
-    )
-    client = GraphQLClient("test-key")
-    result = client.execute(QUERY)
+    respx_mock.post(GQL_URL).mock(side_effect=[SERVER_ERROR, OK_DATA])
+    result = gql_client.execute(QUERY)
     assert result == {"ok": True}
     assert mock_sleep.call_count == 1
 
 
-@respx.mock
 @patch("rpctl.api.retry.time.sleep")
-def test_execute_server_error_503_exhausted(mock_sleep):
-    """503 across all attempts raises ApiError."""
-    respx.post(GQL_URL).mock(return_value=httpx.Response(503))
-    client = GraphQLClient("test-key")
-    with pytest.raises(ApiError) as exc_info:
-        client.execute(QUERY)
-    assert exc_info.value.status_code == 503
-
-
-@respx.mock
-@patch("rpctl.api.retry.time.sleep")
-def test_execute_graphql_body_errors(mock_sleep):
+def test_execute_graphql_body_errors(mock_sleep, respx_mock, gql_client):
     """GraphQL errors in response body raise ApiError (not retried)."""
-    respx.post(GQL_URL).mock(
-        return_value=httpx.Response(
-            200,
-            json={
-                "errors": [{"message": "Field 'foo' not found"}],
-            },
-        )
-    )
-    client = GraphQLClient("test-key")
+    respx_mock.post(GQL_URL).mock(return_value=FIELD_ERROR)
     with pytest.raises(ApiError, match="Field 'foo' not found"):
-        client.execute(QUERY)
+        gql_client.execute(QUERY)
     mock_sleep.assert_not_called()
 
 
-@respx.mock
 @patch("rpctl.api.retry.time.sleep")
-def test_execute_connect_error(mock_sleep):
+def test_execute_connect_error(mock_sleep, respx_mock, gql_client):
     """Connection error is retried as transient."""
-    call_count = 0
-    original_side_effects = [
-        httpx.ConnectError("Connection refused"),
-        httpx.Response(200, json={"data": {"ok": True}}),
-    ]
-
-    def side_effect(request):
-        nonlocal call_count
-        result = original_side_effects[call_count]
-        call_count += 1
-        if isinstance(result, Exception):
-            raise result
-        return result
-
-    respx.post(GQL_URL).mock(side_effect=side_effect)
-    client = GraphQLClient("test-key")
-    result = client.execute(QUERY)
+    respx_mock.post(GQL_URL).mock(
+        side_effect=[
+            httpx.ConnectError("Connection refused"),
+            OK_DATA,
+        ]
+    )
+    result = gql_client.execute(QUERY)
     assert result == {"ok": True}
     assert mock_sleep.call_count == 1
 
 
-@respx.mock
 @patch("rpctl.api.retry.time.sleep")
-def test_execute_timeout(mock_sleep):
+def test_execute_timeout(mock_sleep, respx_mock, gql_client):
     """Timeout is retried as transient."""
-    call_count = 0
-    original_side_effects = [
-        httpx.ReadTimeout("timed out"),
-        httpx.Response(200, json={"data": {"ok": True}}),
-    ]
-
-    def side_effect(request):
-        nonlocal call_count
-        result = original_side_effects[call_count]
-        call_count += 1
-        if isinstance(result, Exception):
-            raise result
-        return result
-
-    respx.post(GQL_URL).mock(side_effect=side_effect)
-    client = GraphQLClient("test-key")
-    result = client.execute(QUERY)
+    respx_mock.post(GQL_URL).mock(
+        side_effect=[
+            httpx.ReadTimeout("timed out"),
+            OK_DATA,
+        ]
+    )
+    result = gql_client.execute(QUERY)
     assert result == {"ok": True}
     assert mock_sleep.call_count == 1
 
 
-@respx.mock
-@patch("rpctl.api.retry.time.sleep")
-def test_execute_non_200_non_transient(mock_sleep):
-    """400 response raises immediately (not retried)."""
-    respx.post(GQL_URL).mock(return_value=httpx.Response(400))
-    client = GraphQLClient("test-key")
-    with pytest.raises(ApiError) as exc_info:
-        client.execute(QUERY)
-    assert exc_info.value.status_code == 400
-    assert not exc_info.value.is_transient
-    mock_sleep.assert_not_called()
-
-
 def test_context_manager():
     """GraphQLClient works as a context manager."""
     with GraphQLClient("test-key") as client:
         assert client is not None
 
 
-@respx.mock
 @patch("rpctl.api.retry.time.sleep")
-def test_execute_empty_data(mock_sleep):
+def test_execute_empty_data(mock_sleep, respx_mock, gql_client):
     """Response with no data key returns empty dict."""
-    respx.post(GQL_URL).mock(return_value=httpx.Response(200, json={}))
-    client = GraphQLClient("test-key")
-    result = client.execute(QUERY)
+    respx_mock.post(GQL_URL).mock(return_value=EMPTY_BODY)
+    result = gql_client.execute(QUERY)
     assert result == {}
+    mock_sleep.assert_not_called()
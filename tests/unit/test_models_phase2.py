@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import warnings
+
+import pytest
+
 from rpctl.models.endpoint import Endpoint, EndpointCreateParams
 from rpctl.models.pod import Pod, PodCreateParams
 from rpctl.models.template import Template
@@ -38,6 +42,45 @@ class TestPod:
         assert pod.id == "pod-min"
         assert pod.status == ""
 
+    def test_from_api_coerces_types(self, monkeypatch):
+        """The mapping itself normalizes types, since validation is skipped."""
+        monkeypatch.delenv("RPCTL_STRICT_VALIDATE", raising=False)
+        pod = Pod.from_api(
+            {
+                "id": "pod-1",
+                "name": None,
+                "gpuCount": "2",
+                "vcpu": None,
+                "memoryInGb": 15.5,
+                "costPerHr": "0.44",
+            }
+        )
+        assert pod.name == ""
+        assert pod.gpu_count == 2
+        assert pod.vcpu_count == 0
+        assert pod.memory_mb == 15872
+        assert type(pod.memory_mb) is int
+        assert pod.cost_per_hr == 0.44
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # no PydanticSerializationUnexpectedValue
+            assert pod == Pod.model_validate(pod.model_dump())
+
+    def test_from_api_strict_validation(self, monkeypatch):
+        monkeypatch.setenv("RPCTL_STRICT_VALIDATE", "1")
+        pod = Pod.from_api({"id": "pod-1", "gpuCount": "2"})
+        assert pod.gpu_count == 2
+        with pytest.raises(ValueError):
+            Pod.from_api({"id": "pod-1", "gpuCount": "two"})
+
+    def test_from_api_list(self, monkeypatch):
+        raws = [{"id": "pod-1", "runtime": {"status": "RUNNING"}}, {"id": "pod-2"}]
+        monkeypatch.delenv("RPCTL_STRICT_VALIDATE", raising=False)
+        assert [p.id for p in Pod.from_api_list(raws)] == ["pod-1", "pod-2"]
+        monkeypatch.setenv("RPCTL_STRICT_VALIDATE", "1")
+        pods = Pod.from_api_list(raws)
+        assert pods == [Pod.from_api(r) for r in raws]
+        assert pods[0].status == "RUNNING"
+
     def test_create_params_to_sdk(self):
         params = PodCreateParams(
             name="test",
@@ -2,6 +2,13 @@
 
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+
+import pytest
+
 from rpctl.models.capacity import (
     Datacenter,
     DatacenterGpu,
@@ -15,10 +22,12 @@ from rpctl.models.pod import Pod, PodCreateParams
 from rpctl.models.preset import Preset, PresetMetadata
 from rpctl.models.template import Template
 from rpctl.models.volume import Volume
+from rpctl.output import json_output
 from rpctl.output.formatter import output
 from rpctl.output.json_output import print_json
 from rpctl.output.tables import (
     _detail_table,
+    _pod_row,
     _price_str,
     _status_style,
     _stock_style,
@@ -230,6 +239,18 @@ def test_print_pod_list_empty():
     print_pod_list([])
 
 
+def test_pod_row():
+    assert _pod_row(_pod()) == (
+        "pod-001",
+        "test-pod",
+        "[green]RUNNING[/green]",
+        "1x NVIDIA RTX A6000",
+        "runpod/pytorch:2.1",
+        "$0.4400/hr",
+    )
+    assert _pod_row(Pod(id="pod-002"))[1:] == ("-", "", "-", "-", "-")
+
+
 def test_print_pod_detail():
     print_pod_detail(_pod())
 
@@ -405,6 +426,61 @@ def test_print_json_string():
     print_json("hello")
 
 
+class _Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class _Point:
+    x: int
+    at: datetime
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param({"key": "value", "n": [1, 2], "f": 0.5}, id="ascii"),
+        pytest.param({"n": "café"}, id="non-ascii"),
+        pytest.param({"n": float("nan"), "m": [float("inf")], "z": None}, id="non-finite"),
+        pytest.param({"n": 2**70}, id="big-int"),
+        pytest.param({"f": 1e16, "g": 1e-05, "h": 123456789.25}, id="floats"),
+        pytest.param({"t": datetime(2024, 1, 2, 3, 4, 5), "d": date(2024, 1, 2)}, id="datetime"),
+        pytest.param({"e": _Color.RED}, id="enum"),
+        pytest.param({"p": _Point(1, datetime(2024, 1, 2))}, id="dataclass"),
+        pytest.param({1: "int-key", "s": set()}, id="other"),
+    ],
+)
+def test_print_json_orjson_parity(monkeypatch, capsys, data):
+    """With and without orjson, print_json emits identical text."""
+    pytest.importorskip("orjson")
+    print_json(data)
+    fast = capsys.readouterr().out
+
+    monkeypatch.setattr(json_output, "orjson", None)
+    print_json(data)
+    assert capsys.readouterr().out == fast
+
+
+def test_print_json_default_hook(monkeypatch, capsys):
+    """Datetimes, enums and dataclasses encode as ISO strings, values and objects."""
+    monkeypatch.setattr(json_output, "orjson", None)
+    print_json(
+        {"t": datetime(2024, 1, 2, 3, 4, 5), "e": _Color.RED, "p": _Point(1, datetime(2024, 1, 2))}
+    )
+    assert json.loads(capsys.readouterr().out) == {
+        "t": "2024-01-02T03:04:05",
+        "e": "red",
+        "p": {"x": 1, "at": "2024-01-02T00:00:00"},
+    }
+
+
+def test_print_json_stdlib_flags(monkeypatch, capsys):
+    """The stdlib path keeps json.dumps defaults: ASCII escapes and NaN literals."""
+    monkeypatch.setattr(json_output, "orjson", None)
+    print_json({"n": "café", "f": float("nan")})
+    assert capsys.readouterr().out == '{\n  "n": "caf\\u00e9",\n  "f": NaN\n}\n'
+
+
 # --- Formatter routing ---
 
 
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
 from unittest.mock import patch
 
+import yaml
+
 from rpctl.models.pod import Pod
 from rpctl.output.csv_output import _flatten, print_csv
 from rpctl.output.formatter import output
+from rpctl.output.tables import print_pod_list
 from rpctl.output.yaml_output import print_yaml
 
 
@@ -67,6 +73,11 @@ def test_flatten_list():
     assert result == {"tags": "a;b;c"}
 
 
+def test_flatten_deep_keeps_key_order():
+    result = _flatten({"a": {"b": {"c": 1}, "d": 2}, "e": 3})
+    assert list(result.items()) == [("a.b.c", 1), ("a.d", 2), ("e", 3)]
+
+
 # --- YAML output ---
 
 
@@ -89,12 +100,48 @@ def test_yaml_dict(capsys):
     assert "key: value" in captured.out
 
 
+class _Status(Enum):
+    RUNNING = "RUNNING"
+
+
+def test_yaml_dict_with_python_objects(capsys):
+    """Pass-through dicts holding non-JSON types are coerced, not rejected."""
+    print_yaml(
+        [
+            {
+                "created": datetime(2024, 1, 2, 3, 4, 5),
+                "path": Path("/workspace"),
+                "status": _Status.RUNNING,
+                "ports": (22, 8888),
+            }
+        ]
+    )
+    assert yaml.safe_load(capsys.readouterr().out) == [
+        {
+            "created": "2024-01-02T03:04:05",
+            "path": "/workspace",
+            "status": "RUNNING",
+            "ports": [22, 8888],
+        }
+    ]
+
+
 def test_yaml_string(capsys):
     print_yaml("hello")
     captured = capsys.readouterr()
     assert "hello" in captured.out
 
 
+def test_yaml_without_libyaml(monkeypatch, capsys):
+    """Falls back to the pure-Python SafeDumper when libyaml is unavailable."""
+    print_yaml([_pod()])
+    fast = capsys.readouterr().out
+
+    monkeypatch.delattr(yaml, "CSafeDumper", raising=False)
+    print_yaml([_pod()])
+    assert capsys.readouterr().out == fast
+
+
 # --- Formatter routing ---
 
 
@@ -118,8 +165,6 @@ def test_output_format_yaml():
 
 def test_output_format_table():
     """Table format uses the registered renderer."""
-    from rpctl.output.tables import print_pod_list
-
     with patch.dict("rpctl.output.formatter.TABLE_RENDERERS", {"pod_list": print_pod_list}):
         # Just verify it doesn't crash — table renderer prints to console
         output([_pod()], output_format="table", table_type="pod_list")
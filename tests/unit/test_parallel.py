@@ -114,3 +114,9 @@ def test_parallel_map_preserves_exception_types():
     assert len(result.failed) == 1
     _item, exc = result.failed[0]
     assert isinstance(exc, TypeError)
+
+
+def test_parallel_map_results_in_input_order():
+    """Without stop_on_error, results are collected in input order."""
+    result = parallel_map(lambda x: x, list(range(30)), max_workers=8)
+    assert result.succeeded == list(range(30))
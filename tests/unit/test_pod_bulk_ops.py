@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
-
-from typer.testing import CliRunner
+import pytest
+import typer
 
+from rpctl.cli import pod as pod_cli
 from rpctl.errors import RpctlError
 from rpctl.main import app
 from rpctl.models.pod import Pod
-
-runner = CliRunner()
+from rpctl.services.parallel import BatchResult
+from tests.helpers.cli import runner
 
 
 def _make_pod(pod_id: str, name: str = "test", status: str = "RUNNING") -> Pod:
@@ -24,199 +24,135 @@ def _make_pod(pod_id: str, name: str = "test", status: str = "RUNNING") -> Pod:
     )
 
 
+def _two_pods() -> list[Pod]:
+    return [_make_pod("p1"), _make_pod("p2")]
+
+
 # --- stop-all ---
 
 
-def test_stop_all_no_pods():
+def test_stop_all_no_pods(fake_pod_service, cli_ctx, capsys):
     """stop-all with no running pods prints message and exits 0."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.list_pods.return_value = []
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(app, ["pod", "stop-all", "--confirm"])
-        assert result.exit_code == 0
-        assert "No running pods" in result.output
+    pod_cli.stop_all(cli_ctx, confirm=True, parallel=False, max_workers=5)
+    assert "No running pods" in capsys.readouterr().out
 
 
-def test_stop_all_confirm_sequential():
+def test_stop_all_confirm_sequential(fake_pod_service, cli_ctx):
     """stop-all --confirm stops pods sequentially."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.list_pods.return_value = [_make_pod("p1"), _make_pod("p2")]
-        mock_svc.stop_pod.return_value = {}
-        mock_svc_fn.return_value = mock_svc
+    fake_pod_service.pods = _two_pods()
 
-        result = runner.invoke(app, ["pod", "stop-all", "--confirm"])
-        assert result.exit_code == 0
-        assert mock_svc.stop_pod.call_count == 2
+    pod_cli.stop_all(cli_ctx, confirm=True, parallel=False, max_workers=5)
+    assert fake_pod_service.stopped == ["p1", "p2"]
 
 
-def test_stop_all_sequential_error():
+def test_stop_all_sequential_error(fake_pod_service, cli_ctx, capsys):
     """stop-all sequential prints error for individual pod failures."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.list_pods.return_value = [_make_pod("p1"), _make_pod("p2")]
-        mock_svc.stop_pod.side_effect = [None, RpctlError("fail")]
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(app, ["pod", "stop-all", "--confirm"])
-        assert "Failed to stop" in result.output
+    fake_pod_service.pods = _two_pods()
+    fake_pod_service.stop_results.extend([{}, RpctlError("fail")])
 
+    pod_cli.stop_all(cli_ctx, confirm=True, parallel=False, max_workers=5)
+    assert "Failed to stop p2" in capsys.readouterr().err
 
-def test_stop_all_parallel():
-    """stop-all --parallel --confirm uses parallel_map."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        pods = [_make_pod("p1"), _make_pod("p2")]
-        mock_svc.list_pods.return_value = pods
-        mock_svc_fn.return_value = mock_svc
 
-        with patch("rpctl.services.parallel.parallel_map") as mock_parallel:
-            mock_result = MagicMock()
-            mock_result.succeeded = [({}, _make_pod("p1")), ({}, _make_pod("p2"))]
-            mock_result.failed = []
-            mock_parallel.return_value = mock_result
+def test_stop_all_parallel(fake_pod_service):
+    """stop-all --parallel --confirm uses the bulk service call."""
+    fake_pod_service.pods = _two_pods()
+    fake_pod_service.bulk_result = BatchResult(succeeded=[{}, {}])
 
-            result = runner.invoke(app, ["pod", "stop-all", "--confirm", "--parallel"])
-            assert result.exit_code == 0
-            mock_parallel.assert_called_once()
+    result = runner.invoke(app, ["pod", "stop-all", "--confirm", "--parallel", "--workers", "3"])
+    assert result.exit_code == 0
+    assert fake_pod_service.bulk_calls == [("stop_pods", ["p1", "p2"], {"max_workers": 3})]
 
 
-def test_stop_all_parallel_with_failures():
+def test_stop_all_parallel_with_failures(fake_pod_service, cli_ctx):
     """stop-all --parallel exits 1 when some pods fail."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        pods = [_make_pod("p1"), _make_pod("p2")]
-        mock_svc.list_pods.return_value = pods
-        mock_svc_fn.return_value = mock_svc
-
-        with patch("rpctl.services.parallel.parallel_map") as mock_parallel:
-            mock_result = MagicMock()
-            mock_result.succeeded = [({}, _make_pod("p1"))]
-            mock_result.failed = [(_make_pod("p2"), Exception("timeout"))]
-            mock_parallel.return_value = mock_result
+    fake_pod_service.pods = _two_pods()
+    fake_pod_service.bulk_result = BatchResult(
+        succeeded=[{}], failed=[("p2", Exception("timeout"))]
+    )
 
-            result = runner.invoke(app, ["pod", "stop-all", "--confirm", "--parallel"])
-            assert result.exit_code == 1
+    with pytest.raises(typer.Exit) as exc_info:
+        pod_cli.stop_all(cli_ctx, confirm=True, parallel=True, max_workers=5)
+    assert exc_info.value.exit_code == 1
 
 
-def test_stop_all_api_error():
+def test_stop_all_api_error(fake_pod_service, cli_ctx):
     """stop-all exits 1 on API error during list."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.list_pods.side_effect = RpctlError("API down")
-        mock_svc_fn.return_value = mock_svc
+    fake_pod_service.list_error = RpctlError("API down")
 
-        result = runner.invoke(app, ["pod", "stop-all", "--confirm"])
-        assert result.exit_code == 1
+    with pytest.raises(typer.Exit) as exc_info:
+        pod_cli.stop_all(cli_ctx, confirm=True, parallel=False, max_workers=5)
+    assert exc_info.value.exit_code == 1
 
 
-def test_stop_all_prompt_abort():
+def test_stop_all_prompt_abort(fake_pod_service):
     """stop-all without --confirm prompts and aborts on 'n'."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.list_pods.return_value = [_make_pod("p1")]
-        mock_svc_fn.return_value = mock_svc
+    fake_pod_service.pods = [_make_pod("p1")]
 
-        result = runner.invoke(app, ["pod", "stop-all"], input="n\n")
-        assert result.exit_code != 0  # typer.Abort
+    result = runner.invoke(app, ["pod", "stop-all"], input="n\n")
+    assert result.exit_code != 0  # typer.Abort
 
 
 # --- delete-all ---
 
 
-def test_delete_all_no_pods():
+def test_delete_all_no_pods(fake_pod_service, cli_ctx, capsys):
     """delete-all with no pods prints message and exits 0."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.list_pods.return_value = []
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(app, ["pod", "delete-all", "--confirm"])
-        assert result.exit_code == 0
-        assert "No pods to delete" in result.output
+    pod_cli.delete_all(cli_ctx, confirm=True, parallel=False, max_workers=5)
+    assert "No pods to delete" in capsys.readouterr().out
 
 
-def test_delete_all_confirm_sequential():
+def test_delete_all_confirm_sequential(fake_pod_service, cli_ctx):
     """delete-all --confirm deletes pods sequentially."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.list_pods.return_value = [_make_pod("p1"), _make_pod("p2")]
-        mock_svc.delete_pod.return_value = {}
-        mock_svc_fn.return_value = mock_svc
+    fake_pod_service.pods = _two_pods()
 
-        result = runner.invoke(app, ["pod", "delete-all", "--confirm"])
-        assert result.exit_code == 0
-        assert mock_svc.delete_pod.call_count == 2
+    pod_cli.delete_all(cli_ctx, confirm=True, parallel=False, max_workers=5)
+    assert fake_pod_service.deleted == ["p1", "p2"]
 
 
-def test_delete_all_sequential_error():
+def test_delete_all_sequential_error(fake_pod_service, cli_ctx, capsys):
     """delete-all sequential prints error for individual pod failures."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.list_pods.return_value = [_make_pod("p1"), _make_pod("p2")]
-        mock_svc.delete_pod.side_effect = [None, RpctlError("fail")]
-        mock_svc_fn.return_value = mock_svc
+    fake_pod_service.pods = _two_pods()
+    fake_pod_service.delete_results.extend([{}, RpctlError("fail")])
 
-        result = runner.invoke(app, ["pod", "delete-all", "--confirm"])
-        assert "Failed to delete" in result.output
+    pod_cli.delete_all(cli_ctx, confirm=True, parallel=False, max_workers=5)
+    assert "Failed to delete p2" in capsys.readouterr().err
 
 
-def test_delete_all_parallel():
-    """delete-all --parallel --confirm uses parallel_map."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        pods = [_make_pod("p1"), _make_pod("p2")]
-        mock_svc.list_pods.return_value = pods
-        mock_svc_fn.return_value = mock_svc
+def test_delete_all_parallel(fake_pod_service):
+    """delete-all --parallel --confirm uses the bulk service call."""
+    fake_pod_service.pods = _two_pods()
+    fake_pod_service.bulk_result = BatchResult(succeeded=[{}, {}])
 
-        with patch("rpctl.services.parallel.parallel_map") as mock_parallel:
-            mock_result = MagicMock()
-            mock_result.succeeded = [({}, _make_pod("p1")), ({}, _make_pod("p2"))]
-            mock_result.failed = []
-            mock_parallel.return_value = mock_result
+    result = runner.invoke(app, ["pod", "delete-all", "--confirm", "--parallel", "--workers", "3"])
+    assert result.exit_code == 0
+    assert fake_pod_service.bulk_calls == [("delete_pods", ["p1", "p2"], {"max_workers": 3})]
 
-            result = runner.invoke(app, ["pod", "delete-all", "--confirm", "--parallel"])
-            assert result.exit_code == 0
-            mock_parallel.assert_called_once()
 
-
-def test_delete_all_parallel_with_failures():
+def test_delete_all_parallel_with_failures(fake_pod_service, cli_ctx):
     """delete-all --parallel exits 1 when some pods fail."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        pods = [_make_pod("p1"), _make_pod("p2")]
-        mock_svc.list_pods.return_value = pods
-        mock_svc_fn.return_value = mock_svc
-
-        with patch("rpctl.services.parallel.parallel_map") as mock_parallel:
-            mock_result = MagicMock()
-            mock_result.succeeded = [({}, _make_pod("p1"))]
-            mock_result.failed = [(_make_pod("p2"), Exception("timeout"))]
-            mock_parallel.return_value = mock_result
+    fake_pod_service.pods = _two_pods()
+    fake_pod_service.bulk_result = BatchResult(
+        succeeded=[{}], failed=[("p2", Exception("timeout"))]
+    )
 
-            result = runner.invoke(app, ["pod", "delete-all", "--confirm", "--parallel"])
-            assert result.exit_code == 1
+    with pytest.raises(typer.Exit) as exc_info:
+        pod_cli.delete_all(cli_ctx, confirm=True, parallel=True, max_workers=5)
+    assert exc_info.value.exit_code == 1
 
 
-def test_delete_all_api_error():
+def test_delete_all_api_error(fake_pod_service, cli_ctx):
     """delete-all exits 1 on API error during list."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.list_pods.side_effect = RpctlError("API down")
-        mock_svc_fn.return_value = mock_svc
+    fake_pod_service.list_error = RpctlError("API down")
 
-        result = runner.invoke(app, ["pod", "delete-all", "--confirm"])
-        assert result.exit_code == 1
+    with pytest.raises(typer.Exit) as exc_info:
+        pod_cli.delete_all(cli_ctx, confirm=True, parallel=False, max_workers=5)
+    assert exc_info.value.exit_code == 1
 
 
-def test_delete_all_prompt_abort():
+def test_delete_all_prompt_abort(fake_pod_service):
     """delete-all without --confirm prompts and aborts on 'n'."""
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.list_pods.return_value = [_make_pod("p1")]
-        mock_svc_fn.return_value = mock_svc
+    fake_pod_service.pods = [_make_pod("p1")]
 
-        result = runner.invoke(app, ["pod", "delete-all"], input="n\n")
-        assert result.exit_code != 0  # typer.Abort
+    result = runner.invoke(app, ["pod", "delete-all"], input="n\n")
+    assert result.exit_code != 0  # typer.Abort
@@ -6,58 +6,60 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from rpctl.cli import pod as pod_cli
 from rpctl.errors import RpctlError
+from rpctl.main import app
 from rpctl.models.pod import Pod, PodCreateParams
+from rpctl.services.pod_service import PodService
 from rpctl.services.poll import PollTimeoutError
-
-# --- PodCreateParams.to_sdk_kwargs() mapping ---
-
-
-def test_to_sdk_kwargs_docker_start_cmd():
-    """docker_start_cmd is passed through to SDK kwargs."""
-    params = PodCreateParams(
-        image_name="test",
-        docker_start_cmd="python handler.py",
-    )
-    kwargs = params.to_sdk_kwargs()
-    assert kwargs["docker_start_cmd"] == "python handler.py"
-
-
-def test_to_sdk_kwargs_docker_entrypoint():
-    """docker_entrypoint maps to docker_args in SDK kwargs."""
-    params = PodCreateParams(
-        image_name="test",
-        docker_entrypoint="/bin/bash -c",
-    )
-    kwargs = params.to_sdk_kwargs()
-    assert kwargs["docker_args"] == "/bin/bash -c"
+from tests.helpers.cli import runner
+
+# Only ever handed back by the mocked service, so one instance serves every test.
+_DEFAULT_POD = Pod(
+    id="pod-123",
+    name="test-pod",
+    status="RUNNING",
+    gpu_type="A100",
+    gpu_count=1,
+    image_name="nvidia/cuda",
+)
+
+
+@pytest.fixture(scope="module")
+def mock_svc():
+    """MagicMock pod service patched in once for the whole module."""
+    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
+        mock_svc_fn.return_value = MagicMock()
+        yield mock_svc_fn.return_value
 
 
-def test_to_sdk_kwargs_allowed_cuda_versions():
-    """allowed_cuda_versions is passed through to SDK kwargs."""
-    params = PodCreateParams(
-        image_name="test",
-        allowed_cuda_versions=["11.8", "12.1"],
-    )
-    kwargs = params.to_sdk_kwargs()
-    assert kwargs["allowed_cuda_versions"] == ["11.8", "12.1"]
+@pytest.fixture(autouse=True)
+def _reset_mock_svc(mock_svc):
+    """Clear calls, return values and side effects between tests."""
+    mock_svc.reset_mock(return_value=True, side_effect=True)
 
 
-def test_to_sdk_kwargs_support_public_ip():
-    """support_public_ip is passed through when True."""
-    params = PodCreateParams(
-        image_name="test",
-        support_public_ip=True,
-    )
-    kwargs = params.to_sdk_kwargs()
-    assert kwargs["support_public_ip"] is True
+# --- PodCreateParams.to_sdk_kwargs() mapping ---
 
 
-def test_to_sdk_kwargs_start_ssh_disabled():
-    """start_ssh=False is passed through to SDK kwargs."""
-    params = PodCreateParams(image_name="test", start_ssh=False)
-    kwargs = params.to_sdk_kwargs()
-    assert kwargs["start_ssh"] is False
+@pytest.mark.parametrize(
+    ("field", "value", "sdk_key", "expected"),
+    [
+        ("docker_start_cmd", "python handler.py", "docker_start_cmd", "python handler.py"),
+        ("docker_entrypoint", "/bin/bash -c", "docker_args", "/bin/bash -c"),
+        ("allowed_cuda_versions", ["11.8", "12.1"], "allowed_cuda_versions", ["11.8", "12.1"]),
+        ("support_public_ip", True, "support_public_ip", True),
+        ("start_ssh", False, "start_ssh", False),
+        ("country_code", "US", "country_code", "US"),
+        ("min_download", 500, "min_download", 500),
+        ("min_upload", 250, "min_upload", 250),
+    ],
+)
+def test_to_sdk_kwargs_field(field, value, sdk_key, expected):
+    """Optional create fields are passed through (or renamed) in SDK kwargs."""
+    kwargs = PodCreateParams(image_name="test", **{field: value}).to_sdk_kwargs()
+    assert kwargs[sdk_key] == expected
+    assert type(kwargs[sdk_key]) is type(expected)
 
 
 def test_to_sdk_kwargs_start_ssh_default():
@@ -67,352 +69,173 @@ def test_to_sdk_kwargs_start_ssh_default():
     assert "start_ssh" not in kwargs
 
 
-def test_to_sdk_kwargs_country_code():
-    """country_code is passed through to SDK kwargs."""
-    params = PodCreateParams(image_name="test", country_code="US")
-    kwargs = params.to_sdk_kwargs()
-    assert kwargs["country_code"] == "US"
-
-
-def test_to_sdk_kwargs_min_download():
-    """min_download is passed through to SDK kwargs."""
-    params = PodCreateParams(image_name="test", min_download=500)
-    kwargs = params.to_sdk_kwargs()
-    assert kwargs["min_download"] == 500
-
-
-def test_to_sdk_kwargs_min_upload():
-    """min_upload is passed through to SDK kwargs."""
-    params = PodCreateParams(image_name="test", min_upload=250)
-    kwargs = params.to_sdk_kwargs()
-    assert kwargs["min_upload"] == 250
-
-
 def test_to_sdk_kwargs_no_optional_fields():
     """Optional fields are not included when empty/default."""
     params = PodCreateParams(image_name="test")
     kwargs = params.to_sdk_kwargs()
-    assert "docker_start_cmd" not in kwargs
-    assert "docker_args" not in kwargs
-    assert "allowed_cuda_versions" not in kwargs
-    assert "support_public_ip" not in kwargs
-    assert "start_ssh" not in kwargs
-    assert "country_code" not in kwargs
-    assert "min_download" not in kwargs
-    assert "min_upload" not in kwargs
+    absent = {
+        "docker_start_cmd",
+        "docker_args",
+        "allowed_cuda_versions",
+        "support_public_ip",
+        "start_ssh",
+        "country_code",
+        "min_download",
+        "min_upload",
+    }
+    assert not absent & kwargs.keys()
 
 
 # --- PodService.wait_until_running() ---
 
 
-def _make_pod(status: str = "RUNNING") -> Pod:
-    return Pod(
-        id="pod-123",
-        name="test-pod",
-        status=status,
-        gpu_type="A100",
-        gpu_count=1,
-        image_name="nvidia/cuda",
-    )
+class _PodClientStub:
+    """API client whose get_pod replays *responses*, repeating the last one."""
+
+    def __init__(self, *responses: dict) -> None:
+        self.responses = responses
+        self.calls = 0
 
+    def get_pod(self, _pod_id: str) -> dict:
+        self.calls += 1
+        return self.responses[min(self.calls, len(self.responses)) - 1]
 
-def test_pod_service_wait_immediate():
+
+def test_pod_service_wait_immediate(fake_clock):
     """wait_until_running returns immediately if already running."""
-    from rpctl.services.pod_service import PodService
-
-    mock_client = MagicMock()
-    mock_client.get_pod.return_value = {
-        "id": "pod-123",
-        "name": "test",
-        "imageName": "test",
-        "desiredStatus": "RUNNING",
-        "runtime": {"status": "RUNNING"},
-    }
-    svc = PodService(mock_client)
-    pod = svc.wait_until_running("pod-123", timeout=10, interval=0.01)
+    client = _PodClientStub(
+        {
+            "id": "pod-123",
+            "name": "test",
+            "imageName": "test",
+            "desiredStatus": "RUNNING",
+            "runtime": {"status": "RUNNING"},
+        }
+    )
+    svc = PodService(client)
+    pod = svc.wait_until_running("pod-123", timeout=10, interval=1)
     assert pod.status == "RUNNING"
-    assert mock_client.get_pod.call_count == 1
+    assert client.calls == 1
 
 
-def test_pod_service_wait_transitions():
+def test_pod_service_wait_transitions(fake_clock):
     """wait_until_running polls until RUNNING status."""
-    from rpctl.services.pod_service import PodService
-
-    mock_client = MagicMock()
-    mock_client.get_pod.side_effect = [
+    client = _PodClientStub(
         {"id": "pod-123", "name": "test", "imageName": "x", "runtime": {"status": "CREATED"}},
         {"id": "pod-123", "name": "test", "imageName": "x", "runtime": {"status": "PULLING"}},
         {"id": "pod-123", "name": "test", "imageName": "x", "runtime": {"status": "RUNNING"}},
-    ]
-    svc = PodService(mock_client)
-    pod = svc.wait_until_running("pod-123", timeout=10, interval=0.01)
+    )
+    svc = PodService(client)
+    pod = svc.wait_until_running("pod-123", timeout=10, interval=1)
     assert pod.status == "RUNNING"
-    assert mock_client.get_pod.call_count == 3
+    assert client.calls == 3
+    assert fake_clock.sleeps == [1, 1]
 
 
-def test_pod_service_wait_timeout():
+def test_pod_service_wait_timeout(fake_clock):
     """wait_until_running raises PollTimeoutError on timeout."""
-    from rpctl.services.pod_service import PodService
-
-    mock_client = MagicMock()
-    mock_client.get_pod.return_value = {
-        "id": "pod-123",
-        "name": "test",
-        "imageName": "x",
-        "runtime": {"status": "CREATED"},
-    }
-    svc = PodService(mock_client)
+    client = _PodClientStub(
+        {"id": "pod-123", "name": "test", "imageName": "x", "runtime": {"status": "CREATED"}}
+    )
+    svc = PodService(client)
     with pytest.raises(PollTimeoutError):
-        svc.wait_until_running("pod-123", timeout=0.05, interval=0.01)
+        svc.wait_until_running("pod-123", timeout=10, interval=20)
+    # One poll, one sleep clipped to the deadline, one final poll.
+    assert client.calls == 2
+    assert fake_clock.sleeps == [10]
 
 
 # --- CLI: rpctl pod wait ---
 
 
-def test_cli_pod_wait_success():
+def test_cli_pod_wait_success(mock_svc):
     """rpctl pod wait POD_ID succeeds when pod is running."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
+    mock_svc.wait_until_running.return_value = _DEFAULT_POD
 
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.wait_until_running.return_value = _make_pod("RUNNING")
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(
-            app, ["pod", "wait", "pod-123", "--timeout", "60", "--interval", "2"]
-        )
-        assert result.exit_code == 0
-        mock_svc.wait_until_running.assert_called_once_with("pod-123", timeout=60, interval=2)
+    result = runner.invoke(app, ["pod", "wait", "pod-123", "--timeout", "60", "--interval", "2"])
+    assert result.exit_code == 0
+    mock_svc.wait_until_running.assert_called_once_with("pod-123", timeout=60, interval=2)
 
 
-def test_cli_pod_wait_timeout():
+def test_cli_pod_wait_timeout(mock_svc):
     """rpctl pod wait exits 2 on timeout."""
-    from typer.testing import CliRunner
+    mock_svc.wait_until_running.side_effect = PollTimeoutError("timed out")
 
-    from rpctl.main import app
+    result = runner.invoke(app, ["pod", "wait", "pod-123"])
+    assert result.exit_code == 2
 
-    runner = CliRunner()
 
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.wait_until_running.side_effect = PollTimeoutError("timed out")
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(app, ["pod", "wait", "pod-123"])
-        assert result.exit_code == 2
-
-
-def test_cli_pod_wait_api_error():
+def test_cli_pod_wait_api_error(mock_svc):
     """rpctl pod wait exits 1 on API error."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
+    mock_svc.wait_until_running.side_effect = RpctlError("Not found")
 
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.wait_until_running.side_effect = RpctlError("Not found")
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(app, ["pod", "wait", "pod-bad"])
-        assert result.exit_code == 1
+    result = runner.invoke(app, ["pod", "wait", "pod-bad"])
+    assert result.exit_code == 1
 
 
 # --- CLI: rpctl pod create with new flags ---
 
-
-def test_cli_pod_create_docker_start_cmd():
-    """--docker-start-cmd is passed through to create."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.create_pod.return_value = _make_pod()
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(
-            app,
-            [
-                "pod",
-                "create",
-                "--image",
-                "test",
-                "--docker-start-cmd",
-                "python handler.py",
-            ],
-        )
-        assert result.exit_code == 0
-        call_args = mock_svc.create_pod.call_args[0][0]
-        assert call_args.docker_start_cmd == "python handler.py"
-
-
-def test_cli_pod_create_entrypoint():
-    """--entrypoint is passed through to create."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.create_pod.return_value = _make_pod()
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(
-            app,
-            ["pod", "create", "--image", "test", "--entrypoint", "/bin/bash -c"],
-        )
-        assert result.exit_code == 0
-        call_args = mock_svc.create_pod.call_args[0][0]
-        assert call_args.docker_entrypoint == "/bin/bash -c"
-
-
-def test_cli_pod_create_public_ip():
-    """--public-ip sets support_public_ip=True."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.create_pod.return_value = _make_pod()
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(
-            app,
-            ["pod", "create", "--image", "test", "--public-ip"],
-        )
-        assert result.exit_code == 0
-        call_args = mock_svc.create_pod.call_args[0][0]
-        assert call_args.support_public_ip is True
-
-
-def test_cli_pod_create_cuda_versions():
-    """--cuda-version is repeatable and passed through."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.create_pod.return_value = _make_pod()
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(
-            app,
-            [
-                "pod",
-                "create",
-                "--image",
-                "test",
-                "--cuda-version",
-                "11.8",
-                "--cuda-version",
-                "12.1",
-            ],
-        )
-        assert result.exit_code == 0
-        call_args = mock_svc.create_pod.call_args[0][0]
-        assert call_args.allowed_cuda_versions == ["11.8", "12.1"]
-
-
-def test_cli_pod_create_no_ssh():
-    """--no-ssh sets start_ssh=False."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.create_pod.return_value = _make_pod()
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(
-            app,
-            ["pod", "create", "--image", "test", "--no-ssh"],
-        )
-        assert result.exit_code == 0
-        call_args = mock_svc.create_pod.call_args[0][0]
-        assert call_args.start_ssh is False
-
-
-def test_cli_pod_create_country():
-    """--country sets country_code."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.create_pod.return_value = _make_pod()
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(
-            app,
-            ["pod", "create", "--image", "test", "--country", "US"],
-        )
-        assert result.exit_code == 0
-        call_args = mock_svc.create_pod.call_args[0][0]
-        assert call_args.country_code == "US"
-
-
-def test_cli_pod_create_min_download():
-    """--min-download sets min_download."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.create_pod.return_value = _make_pod()
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(
-            app,
-            ["pod", "create", "--image", "test", "--min-download", "500"],
-        )
-        assert result.exit_code == 0
-        call_args = mock_svc.create_pod.call_args[0][0]
-        assert call_args.min_download == 500
-
-
-def test_cli_pod_create_min_upload():
-    """--min-upload sets min_upload."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
-
-    with patch("rpctl.cli.pod._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.create_pod.return_value = _make_pod()
-        mock_svc_fn.return_value = mock_svc
-
-        result = runner.invoke(
-            app,
-            ["pod", "create", "--image", "test", "--min-upload", "250"],
-        )
-        assert result.exit_code == 0
-        call_args = mock_svc.create_pod.call_args[0][0]
-        assert call_args.min_upload == 250
+# Every ``pod create`` option at its CLI default, for calling the command directly.
+_CREATE_DEFAULTS = {
+    "preset": None,
+    "save_preset": None,
+    "name": None,
+    "image": "test",
+    "gpu": [],
+    "gpu_count": None,
+    "cpu": [],
+    "cloud_type": None,
+    "container_disk": None,
+    "volume_disk": None,
+    "volume_mount": None,
+    "network_volume": None,
+    "ports": None,
+    "env": [],
+    "template": None,
+    "spot": False,
+    "region": [],
+    "min_vcpu": None,
+    "min_ram": None,
+    "docker_start_cmd": None,
+    "entrypoint": None,
+    "public_ip": False,
+    "cuda_versions": [],
+    "no_ssh": False,
+    "country": None,
+    "min_download": None,
+    "min_upload": None,
+    "dry_run": False,
+}
+
+
+def test_cli_pod_create_flags_parsed(mock_svc):
+    """Create flags are parsed by the CLI and passed through to PodCreateParams."""
+    mock_svc.create_pod.return_value = _DEFAULT_POD
+    result = runner.invoke(
+        app,
+        ["pod", "create", "--image", "test", "--cuda-version", "11.8", "--cuda-version", "12.1"],
+    )
+    assert result.exit_code == 0
+    call_args = mock_svc.create_pod.call_args[0][0]
+    assert call_args.allowed_cuda_versions == ["11.8", "12.1"]
+
+
+@pytest.mark.parametrize(
+    ("option", "value", "attr", "expected"),
+    [
+        ("docker_start_cmd", "python handler.py", "docker_start_cmd", "python handler.py"),
+        ("entrypoint", "/bin/bash -c", "docker_entrypoint", "/bin/bash -c"),
+        ("public_ip", True, "support_public_ip", True),
+        ("no_ssh", True, "start_ssh", False),
+        ("country", "US", "country_code", "US"),
+        ("min_download", 500, "min_download", 500),
+        ("min_upload", 250, "min_upload", 250),
+    ],
+)
+def test_cli_pod_create_flag(mock_svc, cli_ctx, option, value, attr, expected):
+    """Create options are passed through to PodCreateParams."""
+    mock_svc.create_pod.return_value = _DEFAULT_POD
+    pod_cli.create(cli_ctx, **{**_CREATE_DEFAULTS, option: value})
+    call_args = mock_svc.create_pod.call_args[0][0]
+    assert getattr(call_args, attr) == expected
+    assert type(getattr(call_args, attr)) is type(expected)
@@ -7,7 +7,7 @@ import pytest
 from rpctl.services.poll import PollTimeoutError, poll_until
 
 
-def test_poll_until_immediate_success():
+def test_poll_until_immediate_success(fake_clock):
     """Check function returns True immediately."""
     calls = 0
 
@@ -18,9 +18,10 @@ def test_poll_until_immediate_success():
 
     poll_until(check, timeout=10, interval=1, label="test")
     assert calls == 1
+    assert fake_clock.sleeps == []
 
 
-def test_poll_until_succeeds_after_retries():
+def test_poll_until_succeeds_after_retries(fake_clock):
     """Check function returns True after a few polls."""
     calls = 0
 
@@ -31,31 +32,27 @@ def test_poll_until_succeeds_after_retries():
             return True, "RUNNING"
         return False, "PENDING"
 
-    poll_until(check, timeout=10, interval=0.01, label="test")
+    poll_until(check, timeout=10, interval=2, label="test")
     assert calls == 3
+    assert fake_clock.sleeps == [2, 2]
 
 
-def test_poll_until_timeout():
-    """Raises PollTimeoutError when timeout exceeded."""
-
-    def check() -> tuple[bool, str]:
-        return False, "PENDING"
-
-    with pytest.raises(PollTimeoutError, match="Timed out"):
-        poll_until(check, timeout=0.05, interval=0.01, label="test-resource")
-
-
-def test_poll_until_timeout_includes_last_status():
-    """Timeout error includes the last status message."""
+def test_poll_until_timeout(fake_clock):
+    """Raises PollTimeoutError with the last status once the timeout is exceeded."""
 
     def check() -> tuple[bool, str]:
         return False, "INITIALIZING"
 
-    with pytest.raises(PollTimeoutError, match="INITIALIZING"):
-        poll_until(check, timeout=0.05, interval=0.01, label="pod")
+    with pytest.raises(PollTimeoutError) as exc_info:
+        poll_until(check, timeout=10, interval=3, label="pod")
+    message = str(exc_info.value)
+    assert "Timed out" in message
+    assert "INITIALIZING" in message
+    # The last sleep is clipped to the time remaining before the deadline.
+    assert fake_clock.sleeps == [3, 3, 3, 1]
 
 
-def test_poll_until_status_changes_printed(capsys):
+def test_poll_until_status_changes_printed(fake_clock):
     """Status changes are printed to stderr."""
     calls = 0
     statuses = ["CREATED", "CREATED", "PULLING", "RUNNING"]
@@ -66,7 +63,7 @@ def test_poll_until_status_changes_printed(capsys):
         calls += 1
         return status == "RUNNING", status
 
-    poll_until(check, timeout=10, interval=0.01, label="pod x")
+    poll_until(check, timeout=10, interval=1, label="pod x")
     # Status messages go to stderr via Rich Console, so we can't easily
     # capture them. Just verify the function completed successfully.
     assert calls >= 3
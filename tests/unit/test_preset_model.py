@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from rpctl.models.preset import Preset, PresetMetadata
 from rpctl.services.preset_service import PresetService
 
@@ -23,9 +25,10 @@ class TestPresetModel:
             params={"template_id": "tmpl-123", "workers_max": 10},
         )
         data = preset.model_dump()
-        restored = Preset(**data)
+        restored = Preset.model_validate(data)
+        assert restored == preset
         assert restored.metadata.resource_type == "endpoint"
-        assert restored.params["workers_max"] == 10
+        assert restored.params == {"template_id": "tmpl-123", "workers_max": 10}
 
     def test_metadata_defaults(self):
         meta = PresetMetadata(name="x", resource_type="pod")
@@ -34,54 +37,47 @@ class TestPresetModel:
         assert meta.source == ""
 
 
-class TestPresetMerge:
-    def test_cli_overrides_win(self):
-        result = PresetService.merge_preset_with_overrides(
+@pytest.mark.parametrize(
+    ("preset", "overrides", "expected"),
+    [
+        pytest.param(
             {"gpu_count": 1, "image_name": "old"},
             {"gpu_count": 4},
-        )
-        assert result["gpu_count"] == 4
-        assert result["image_name"] == "old"
-
-    def test_none_overrides_skipped(self):
-        result = PresetService.merge_preset_with_overrides(
+            {"gpu_count": 4, "image_name": "old"},
+            id="cli-overrides-win",
+        ),
+        pytest.param(
             {"gpu_count": 2},
             {"gpu_count": None, "image_name": None},
-        )
-        assert result["gpu_count"] == 2
-        assert "image_name" not in result
-
-    def test_env_merge_is_additive(self):
-        result = PresetService.merge_preset_with_overrides(
+            {"gpu_count": 2},
+            id="none-overrides-skipped",
+        ),
+        pytest.param(
             {"env": {"A": "1", "B": "2"}},
             {"env": {"B": "override", "C": "3"}},
-        )
-        assert result["env"] == {"A": "1", "B": "override", "C": "3"}
-
-    def test_empty_list_not_applied(self):
-        result = PresetService.merge_preset_with_overrides(
+            {"env": {"A": "1", "B": "override", "C": "3"}},
+            id="env-merge-is-additive",
+        ),
+        pytest.param(
             {"gpu_type_ids": ["RTX A6000"]},
             {"gpu_type_ids": []},
-        )
-        assert result["gpu_type_ids"] == ["RTX A6000"]
-
-    def test_nonempty_list_overrides(self):
-        result = PresetService.merge_preset_with_overrides(
+            {"gpu_type_ids": ["RTX A6000"]},
+            id="empty-list-not-applied",
+        ),
+        pytest.param(
             {"gpu_type_ids": ["RTX A6000"]},
             {"gpu_type_ids": ["RTX 4090"]},
-        )
-        assert result["gpu_type_ids"] == ["RTX 4090"]
-
-    def test_preset_only_no_overrides(self):
-        result = PresetService.merge_preset_with_overrides(
+            {"gpu_type_ids": ["RTX 4090"]},
+            id="nonempty-list-overrides",
+        ),
+        pytest.param(
             {"gpu_count": 2, "image_name": "test"},
             {},
-        )
-        assert result == {"gpu_count": 2, "image_name": "test"}
-
-    def test_overrides_only_no_preset(self):
-        result = PresetService.merge_preset_with_overrides(
-            {},
-            {"gpu_count": 4},
-        )
-        assert result == {"gpu_count": 4}
+            {"gpu_count": 2, "image_name": "test"},
+            id="preset-only",
+        ),
+        pytest.param({}, {"gpu_count": 4}, {"gpu_count": 4}, id="overrides-only"),
+    ],
+)
+def test_merge_preset_with_overrides(preset, overrides, expected):
+    assert PresetService.merge_preset_with_overrides(preset, overrides) == expected
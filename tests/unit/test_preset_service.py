@@ -2,115 +2,124 @@
 
 from __future__ import annotations
 
+import itertools
+
 import pytest
 
 from rpctl.errors import PresetError
 from rpctl.models.endpoint import Endpoint
 from rpctl.models.pod import Pod
 from rpctl.models.preset import Preset, PresetMetadata
-from rpctl.services.preset_service import PresetService
+from rpctl.services.preset_service import PresetService, _validate_name
+
+_DEFAULT_PRESET = Preset(
+    metadata=PresetMetadata(name="test", resource_type="pod", source="cli"),
+    params={"image_name": "nvidia/cuda"},
+)
 
 
-def _make_preset(name: str = "test", resource_type: str = "pod", **params) -> Preset:
-    return Preset(
-        metadata=PresetMetadata(name=name, resource_type=resource_type, source="cli"),
-        params=params or {"image_name": "nvidia/cuda"},
+def _make_preset(name: str = "test", **params) -> Preset:
+    """Variant of _DEFAULT_PRESET; model_copy skips re-validation."""
+    return _DEFAULT_PRESET.model_copy(
+        update={
+            "metadata": _DEFAULT_PRESET.metadata.model_copy(update={"name": name}),
+            "params": params or _DEFAULT_PRESET.params,
+        }
     )
 
 
+_DIR_IDS = itertools.count()
+
+
+@pytest.fixture(scope="module")
+def presets_root(tmp_path_factory):
+    """One temp directory for the module; each test gets its own subdirectory."""
+    # Created once per module under the per-run basetemp, so no numbered suffix is needed.
+    return tmp_path_factory.mktemp("preset_service", numbered=False)
+
+
+@pytest.fixture
+def presets_dir(presets_root, request):
+    """Not-yet-created per-test presets directory.
+
+    Named from the test function plus a counter rather than the node name,
+    whose parametrize ids (e.g. ``../etc/passwd``) are not safe path parts.
+    """
+    return presets_root / f"{request.node.originalname}-{next(_DIR_IDS)}"
+
+
+@pytest.fixture
+def svc(presets_dir):
+    """PresetService over the per-test presets directory."""
+    return PresetService(presets_dir=presets_dir)
+
+
 class TestPresetCRUD:
-    def test_save_creates_directory(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path / "presets")
-        preset = _make_preset()
-        path = svc.save(preset)
+    def test_save_creates_directory(self, svc, presets_dir):
+        assert not presets_dir.exists()
+        path = svc.save(_make_preset())
         assert path.exists()
-        assert (tmp_path / "presets").is_dir()
+        assert presets_dir.is_dir()
 
-    def test_save_writes_valid_yaml(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
-        svc.save(_make_preset())
-        loaded = svc.load("test")
-        assert loaded.metadata.name == "test"
-        assert loaded.params["image_name"] == "nvidia/cuda"
-
-    def test_save_overwrite_blocked(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
+    def test_save_overwrite_blocked(self, svc):
         svc.save(_make_preset())
         with pytest.raises(PresetError, match="already exists"):
             svc.save(_make_preset())
 
-    def test_save_overwrite_allowed(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
-        svc.save(_make_preset())
-        svc.save(_make_preset(image_name="updated"), overwrite=True)
-        loaded = svc.load("test")
-        assert loaded.params["image_name"] == "updated"
-
-    def test_load_nonexistent_raises(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
+    def test_load_nonexistent_raises(self, svc):
         with pytest.raises(PresetError, match="not found"):
             svc.load("nonexistent")
 
-    def test_list_empty(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
+    def test_list_empty(self, svc):
         assert svc.list_presets() == []
 
-    def test_list_multiple(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
+    def test_save_load_roundtrip(self, svc):
         svc.save(_make_preset("alpha"))
         svc.save(_make_preset("beta"))
+        svc.save(_make_preset("beta", image_name="updated"), overwrite=True)
+
         presets = svc.list_presets()
-        assert len(presets) == 2
-        assert presets[0].metadata.name == "alpha"
-        assert presets[1].metadata.name == "beta"
+        assert [p.metadata.name for p in presets] == ["alpha", "beta"]
+        assert presets[0].params["image_name"] == "nvidia/cuda"
+        # The overwrite replaced the file rather than adding a second preset.
+        assert presets[1].params["image_name"] == "updated"
+
+        loaded = svc.load("alpha")
+        assert loaded.metadata.name == "alpha"
+        assert loaded.params["image_name"] == "nvidia/cuda"
 
-    def test_delete_removes_file(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
+    def test_delete_removes_file(self, svc):
         svc.save(_make_preset())
         svc.delete("test")
         assert not svc.exists("test")
 
-    def test_delete_nonexistent_raises(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
+    def test_delete_nonexistent_raises(self, svc):
         with pytest.raises(PresetError, match="not found"):
             svc.delete("nonexistent")
 
-    def test_exists_true(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
+    def test_exists_true(self, svc):
         svc.save(_make_preset())
         assert svc.exists("test") is True
 
-    def test_exists_false(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
+    def test_exists_false(self, svc):
         assert svc.exists("nope") is False
 
 
 class TestNameValidation:
-    def test_valid_names(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
-        for name in ["my-pod", "test_1", "A123", "gpu-dev-env"]:
-            svc.save(_make_preset(name))
-            assert svc.exists(name)
-
-    def test_rejects_path_traversal(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
-        with pytest.raises(PresetError, match="Invalid preset name"):
-            svc.save(_make_preset("../etc/passwd"))
+    @pytest.mark.parametrize("name", ["my-pod", "test_1", "A123", "gpu-dev-env"])
+    def test_valid_names(self, name):
+        _validate_name(name)  # does not raise
 
-    def test_rejects_special_chars(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
+    @pytest.mark.parametrize("name", ["../etc/passwd", "my preset!", ""])
+    def test_rejects_invalid_names(self, svc, name):
+        # save() validates before touching the filesystem.
         with pytest.raises(PresetError, match="Invalid preset name"):
-            svc.save(_make_preset("my preset!"))
-
-    def test_rejects_empty(self, tmp_path):
-        svc = PresetService(presets_dir=tmp_path)
-        with pytest.raises(PresetError, match="Invalid preset name"):
-            svc.save(_make_preset(""))
+            svc.save(_make_preset(name))
 
 
 class TestParamsExtraction:
     def test_from_pod(self):
-        pod = Pod(
+        pod = Pod.model_construct(
             id="pod-123",
             name="my-pod",
             image_name="runpod/pytorch:2.1",
@@ -128,7 +137,7 @@ class TestParamsExtraction:
         assert params["gpu_type_ids"] == ["NVIDIA RTX A6000"]
 
     def test_from_pod_with_env(self):
-        pod = Pod(
+        pod = Pod.model_construct(
             id="pod-123",
             env=[{"key": "TOKEN", "value": "abc"}, {"key": "MODE", "value": "dev"}],
         )
@@ -136,13 +145,13 @@ class TestParamsExtraction:
         assert params["env"] == {"TOKEN": "abc", "MODE": "dev"}
 
     def test_from_pod_minimal(self):
-        pod = Pod(id="pod-min")
+        pod = Pod.model_construct(id="pod-min")
         params = PresetService.params_from_pod(pod)
         assert params["name"] == ""
         assert "gpu_type_ids" not in params  # empty gpu_type is skipped
 
     def test_from_endpoint(self):
-        ep = Endpoint(
+        ep = Endpoint.model_construct(
             id="ep-123",
             name="my-ep",
             template_id="tmpl-123",
@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
-
-from typer.testing import CliRunner
+from unittest.mock import MagicMock
 
 from rpctl.errors import ApiError
+from rpctl.main import app
 from rpctl.services.registry_service import RegistryService
-
-runner = CliRunner()
+from tests.helpers.cli import runner
 
 
 class TestRegistryServiceList:
@@ -33,48 +31,30 @@ class TestRegistryServiceList:
 
 
 class TestRegistryListCLI:
-    @patch("rpctl.cli.registry._get_registry_service")
-    def test_list_table(self, mock_svc_fn):
-        from rpctl.main import app
-
-        mock_svc = MagicMock()
-        mock_svc.list.return_value = [
+    def test_list_table(self, mock_registry_service):
+        mock_registry_service.list.return_value = [
             {"id": "reg-1", "name": "docker-hub"},
         ]
-        mock_svc_fn.return_value = mock_svc
-        result = runner.invoke(app, ["registry", "list"])
+        result = runner.invoke(app, ["registry", "list"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "docker-hub" in result.output
 
-    @patch("rpctl.cli.registry._get_registry_service")
-    def test_list_json(self, mock_svc_fn):
-        from rpctl.main import app
-
-        mock_svc = MagicMock()
-        mock_svc.list.return_value = [
+    def test_list_json(self, mock_registry_service):
+        mock_registry_service.list.return_value = [
             {"id": "reg-1", "name": "docker-hub"},
         ]
-        mock_svc_fn.return_value = mock_svc
-        result = runner.invoke(app, ["--output", "json", "registry", "list"])
+        result = runner.invoke(
+            app, ["--output", "json", "registry", "list"], catch_exceptions=False
+        )
         assert result.exit_code == 0
 
-    @patch("rpctl.cli.registry._get_registry_service")
-    def test_list_empty(self, mock_svc_fn):
-        from rpctl.main import app
-
-        mock_svc = MagicMock()
-        mock_svc.list.return_value = []
-        mock_svc_fn.return_value = mock_svc
-        result = runner.invoke(app, ["registry", "list"])
+    def test_list_empty(self, mock_registry_service):
+        mock_registry_service.list.return_value = []
+        result = runner.invoke(app, ["registry", "list"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "No container registry" in result.output
 
-    @patch("rpctl.cli.registry._get_registry_service")
-    def test_list_error(self, mock_svc_fn):
-        from rpctl.main import app
-
-        mock_svc = MagicMock()
-        mock_svc.list.side_effect = ApiError("Network error")
-        mock_svc_fn.return_value = mock_svc
-        result = runner.invoke(app, ["registry", "list"])
+    def test_list_error(self, mock_registry_service):
+        mock_registry_service.list.side_effect = ApiError("Network error")
+        result = runner.invoke(app, ["registry", "list"], catch_exceptions=False)
         assert result.exit_code != 0
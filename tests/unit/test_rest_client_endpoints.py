@@ -4,26 +4,40 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a RestClient with a mocked runpod SDK."""
+    """RestClient with a mocked runpod SDK, shared by the module's tests."""
     with patch("rpctl.api.rest_client.runpod", create=True):
         from rpctl.api.rest_client import RestClient
 
         c = RestClient.__new__(RestClient)
         c._runpod = MagicMock()
         c._runpod.api_key = "test-key"
-        return c
+        yield c
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_sleep():
+    """Retry backoff sleep, patched out once for the whole module."""
+    with patch("rpctl.api.retry.time.sleep") as m:
+        yield m
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(client, mock_sleep):
+    """Clear SDK and sleep calls, return values and side effects between tests."""
+    client._runpod.reset_mock(return_value=True, side_effect=True)
+    mock_sleep.reset_mock()
 
 
 # --- Endpoint SDK-based methods ---
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_endpoint_health(mock_sleep, client):
+def test_endpoint_health(client):
     mock_ep = MagicMock()
     mock_ep.health.return_value = {"workers": {"idle": 1}}
     client._runpod.Endpoint.return_value = mock_ep
@@ -33,8 +47,7 @@ def test_endpoint_health(mock_sleep, client):
     client._runpod.Endpoint.assert_called_once_with("ep-1")
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_endpoint_run_sync(mock_sleep, client):
+def test_endpoint_run_sync(client):
     mock_ep = MagicMock()
     mock_ep.run_sync.return_value = {"output": "done"}
     client._runpod.Endpoint.return_value = mock_ep
@@ -44,8 +57,7 @@ def test_endpoint_run_sync(mock_sleep, client):
     mock_ep.run_sync.assert_called_once_with({"prompt": "hi"}, 30)
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_endpoint_run_async(mock_sleep, client):
+def test_endpoint_run_async(client):
     mock_ep = MagicMock()
     mock_job = MagicMock()
     mock_job.job_id = "job-abc"
@@ -57,8 +69,7 @@ def test_endpoint_run_async(mock_sleep, client):
     mock_ep.run.assert_called_once_with({"prompt": "hi"})
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_endpoint_purge_queue(mock_sleep, client):
+def test_endpoint_purge_queue(client):
     mock_ep = MagicMock()
     mock_ep.purge_queue.return_value = {"removed": 5}
     client._runpod.Endpoint.return_value = mock_ep
@@ -70,56 +81,52 @@ def test_endpoint_purge_queue(mock_sleep, client):
 
 # --- Endpoint HTTP-based methods ---
 
+SERVERLESS_URL = "https://api.runpod.ai/v2"
 
-@patch("httpx.get")
-def test_endpoint_job_status(mock_get, client):
-    mock_resp = MagicMock()
-    mock_resp.json.return_value = {"status": "COMPLETED", "output": "ok"}
-    mock_get.return_value = mock_resp
+
+def test_endpoint_job_status(client, respx_mock):
+    route = respx_mock.get(f"{SERVERLESS_URL}/ep-1/status/job-1").mock(
+        return_value=httpx.Response(200, json={"status": "COMPLETED", "output": "ok"})
+    )
 
     result = client.endpoint_job_status("ep-1", "job-1")
     assert result == {"status": "COMPLETED", "output": "ok"}
-    mock_get.assert_called_once_with(
-        "https://api.runpod.ai/v2/ep-1/status/job-1",
-        headers={"Authorization": "Bearer test-key"},
-    )
-    mock_resp.raise_for_status.assert_called_once()
+    assert route.calls.last.request.headers["Authorization"] == "Bearer test-key"
+
 
+def test_endpoint_job_status_http_error(client, respx_mock):
+    respx_mock.get(f"{SERVERLESS_URL}/ep-1/status/job-1").mock(return_value=httpx.Response(404))
 
-@patch("httpx.post")
-def test_endpoint_job_cancel(mock_post, client):
-    mock_resp = MagicMock()
-    mock_resp.json.return_value = {"status": "CANCELLED"}
-    mock_post.return_value = mock_resp
+    with pytest.raises(httpx.HTTPStatusError):
+        client.endpoint_job_status("ep-1", "job-1")
+
+
+def test_endpoint_job_cancel(client, respx_mock):
+    route = respx_mock.post(f"{SERVERLESS_URL}/ep-1/cancel/job-1").mock(
+        return_value=httpx.Response(200, json={"status": "CANCELLED"})
+    )
 
     result = client.endpoint_job_cancel("ep-1", "job-1")
     assert result == {"status": "CANCELLED"}
-    mock_post.assert_called_once_with(
-        "https://api.runpod.ai/v2/ep-1/cancel/job-1",
-        headers={"Authorization": "Bearer test-key"},
-    )
-    mock_resp.raise_for_status.assert_called_once()
+    assert route.calls.last.request.headers["Authorization"] == "Bearer test-key"
 
 
-@patch("httpx.get")
-def test_endpoint_stream(mock_get, client):
-    mock_resp = MagicMock()
-    mock_resp.json.return_value = {"stream": [{"output": "chunk1"}, {"output": "chunk2"}]}
-    mock_get.return_value = mock_resp
+def test_endpoint_stream(client, respx_mock):
+    route = respx_mock.get(f"{SERVERLESS_URL}/ep-1/stream/job-1").mock(
+        return_value=httpx.Response(
+            200, json={"stream": [{"output": "chunk1"}, {"output": "chunk2"}]}
+        )
+    )
 
     result = client.endpoint_stream("ep-1", "job-1")
     assert result == [{"output": "chunk1"}, {"output": "chunk2"}]
-    mock_get.assert_called_once_with(
-        "https://api.runpod.ai/v2/ep-1/stream/job-1",
-        headers={"Authorization": "Bearer test-key"},
-    )
+    assert route.calls.last.request.headers["Authorization"] == "Bearer test-key"
 
 
-@patch("httpx.get")
-def test_endpoint_stream_empty(mock_get, client):
-    mock_resp = MagicMock()
-    mock_resp.json.return_value = {}
-    mock_get.return_value = mock_resp
+def test_endpoint_stream_empty(client, respx_mock):
+    respx_mock.get(f"{SERVERLESS_URL}/ep-1/stream/job-1").mock(
+        return_value=httpx.Response(200, json={})
+    )
 
     result = client.endpoint_stream("ep-1", "job-1")
     assert result == []
@@ -128,32 +135,27 @@ def test_endpoint_stream_empty(mock_get, client):
 # --- Registry auth methods ---
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_list_registry_auths(mock_sleep, client):
-    client._runpod.get_user.return_value = {
-        "containerRegistryAuths": [{"id": "ra-1", "name": "docker"}]
-    }
+def test_list_registry_auths(client, monkeypatch):
+    user = {"containerRegistryAuths": [{"id": "ra-1", "name": "docker"}]}
+    monkeypatch.setattr(client._runpod, "get_user", lambda: user)
     result = client.list_registry_auths()
     assert result == [{"id": "ra-1", "name": "docker"}]
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_list_registry_auths_none(mock_sleep, client):
-    client._runpod.get_user.return_value = {"containerRegistryAuths": None}
+def test_list_registry_auths_none(client, monkeypatch):
+    monkeypatch.setattr(client._runpod, "get_user", lambda: {"containerRegistryAuths": None})
     result = client.list_registry_auths()
     assert result == []
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_create_registry_auth(mock_sleep, client):
+def test_create_registry_auth(client):
     client._runpod.create_container_registry_auth.return_value = {"id": "ra-1"}
     result = client.create_registry_auth("docker", "user", "pass")
     assert result == {"id": "ra-1"}
     client._runpod.create_container_registry_auth.assert_called_once_with("docker", "user", "pass")
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_update_registry_auth(mock_sleep, client):
+def test_update_registry_auth(client):
     client._runpod.update_container_registry_auth.return_value = {"id": "ra-1"}
     result = client.update_registry_auth("ra-1", "newuser", "newpass")
     assert result == {"id": "ra-1"}
@@ -162,8 +164,7 @@ def test_update_registry_auth(mock_sleep, client):
     )
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_delete_registry_auth(mock_sleep, client):
+def test_delete_registry_auth(client):
     client._runpod.delete_container_registry_auth.return_value = {}
     result = client.delete_registry_auth("ra-1")
     assert result == {}
@@ -173,15 +174,13 @@ def test_delete_registry_auth(mock_sleep, client):
 # --- User methods ---
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_get_user(mock_sleep, client):
-    client._runpod.get_user.return_value = {"id": "user-1", "email": "a@b.com"}
+def test_get_user(client, monkeypatch):
+    monkeypatch.setattr(client._runpod, "get_user", lambda: {"id": "user-1", "email": "a@b.com"})
     result = client.get_user()
     assert result == {"id": "user-1", "email": "a@b.com"}
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_update_user_settings(mock_sleep, client):
+def test_update_user_settings(client):
     client._runpod.update_user_settings.return_value = {"id": "user-1"}
     result = client.update_user_settings("ssh-rsa AAAA")
     assert result == {"id": "user-1"}
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import random
 
 import pytest
 
@@ -10,16 +10,14 @@ from rpctl.api.retry import _calculate_delay, retry_on_transient
 from rpctl.errors import ApiError, AuthenticationError, ResourceNotFoundError
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_no_retry_on_success(mock_sleep):
+def test_no_retry_on_success(fake_sleep):
     """Successful function should be called once, no retry."""
     result = retry_on_transient(lambda: "ok")
     assert result == "ok"
-    mock_sleep.assert_not_called()
+    assert fake_sleep.sleeps == []
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_retry_on_transient_error(mock_sleep):
+def test_retry_on_transient_error(fake_sleep):
     """Transient ApiError should be retried up to max_attempts."""
     call_count = 0
 
@@ -33,11 +31,10 @@ def test_retry_on_transient_error(mock_sleep):
     result = retry_on_transient(flaky, max_attempts=3)
     assert result == "recovered"
     assert call_count == 3
-    assert mock_sleep.call_count == 2
+    assert len(fake_sleep.sleeps) == 2
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_no_retry_on_permanent_error(mock_sleep):
+def test_no_retry_on_permanent_error(fake_sleep):
     """Non-transient ApiError should raise immediately."""
 
     def bad_request():
@@ -45,11 +42,10 @@ def test_no_retry_on_permanent_error(mock_sleep):
 
     with pytest.raises(ApiError, match="bad request"):
         retry_on_transient(bad_request)
-    mock_sleep.assert_not_called()
+    assert fake_sleep.sleeps == []
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_no_retry_on_auth_error(mock_sleep):
+def test_no_retry_on_auth_error(fake_sleep):
     """AuthenticationError should never be retried."""
 
     def auth_fail():
@@ -57,11 +53,10 @@ def test_no_retry_on_auth_error(mock_sleep):
 
     with pytest.raises(AuthenticationError):
         retry_on_transient(auth_fail)
-    mock_sleep.assert_not_called()
+    assert fake_sleep.sleeps == []
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_no_retry_on_not_found(mock_sleep):
+def test_no_retry_on_not_found(fake_sleep):
     """ResourceNotFoundError should never be retried."""
 
     def not_found():
@@ -69,11 +64,10 @@ def test_no_retry_on_not_found(mock_sleep):
 
     with pytest.raises(ResourceNotFoundError):
         retry_on_transient(not_found)
-    mock_sleep.assert_not_called()
+    assert fake_sleep.sleeps == []
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_retry_on_connection_error(mock_sleep):
+def test_retry_on_connection_error(fake_sleep):
     """ConnectionError should be retried."""
     call_count = 0
 
@@ -87,11 +81,10 @@ def test_retry_on_connection_error(mock_sleep):
     result = retry_on_transient(flaky_network, max_attempts=3)
     assert result == "connected"
     assert call_count == 2
-    assert mock_sleep.call_count == 1
+    assert len(fake_sleep.sleeps) == 1
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_retry_on_timeout_error(mock_sleep):
+def test_retry_on_timeout_error(fake_sleep):
     """TimeoutError should be retried."""
     call_count = 0
 
@@ -107,8 +100,7 @@ def test_retry_on_timeout_error(mock_sleep):
     assert call_count == 2
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_retry_on_os_error(mock_sleep):
+def test_retry_on_os_error(fake_sleep):
     """OSError should be retried."""
     call_count = 0
 
@@ -124,8 +116,7 @@ def test_retry_on_os_error(mock_sleep):
     assert call_count == 2
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_max_attempts_exhausted_transient(mock_sleep):
+def test_max_attempts_exhausted_transient(fake_sleep):
     """Should raise after max_attempts on persistent transient errors."""
 
     def always_fail():
@@ -133,11 +124,10 @@ def test_max_attempts_exhausted_transient(mock_sleep):
 
     with pytest.raises(ApiError, match="server down"):
         retry_on_transient(always_fail, max_attempts=3)
-    assert mock_sleep.call_count == 2  # sleeps between attempts 1-2 and 2-3
+    assert len(fake_sleep.sleeps) == 2  # sleeps between attempts 1-2 and 2-3
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_max_attempts_exhausted_connection(mock_sleep):
+def test_max_attempts_exhausted_connection(fake_sleep):
     """ConnectionError should wrap in ApiError after max attempts."""
 
     def always_fail():
@@ -147,8 +137,7 @@ def test_max_attempts_exhausted_connection(mock_sleep):
         retry_on_transient(always_fail, max_attempts=3)
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_respects_retry_after(mock_sleep):
+def test_respects_retry_after(fake_sleep):
     """Should use Retry-After value when present on error."""
     call_count = 0
 
@@ -164,12 +153,10 @@ def test_respects_retry_after(mock_sleep):
     result = retry_on_transient(rate_limited, max_attempts=3)
     assert result == "ok"
     # Should have slept for 5.0 seconds (the Retry-After value)
-    mock_sleep.assert_called_once()
-    assert mock_sleep.call_args[0][0] == 5.0
+    assert fake_sleep.sleeps == [5.0]
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_retry_after_capped_by_max_delay(mock_sleep):
+def test_retry_after_capped_by_max_delay(fake_sleep):
     """Retry-After value should be capped by max_delay."""
     call_count = 0
 
@@ -184,15 +171,18 @@ def test_retry_after_capped_by_max_delay(mock_sleep):
 
     result = retry_on_transient(rate_limited, max_attempts=3, max_delay=10.0)
     assert result == "ok"
-    assert mock_sleep.call_args[0][0] == 10.0
+    assert fake_sleep.sleeps == [10.0]
+
+
+def _no_jitter(a: float, _b: float) -> float:
+    return a
 
 
 def test_calculate_delay_exponential():
     """Delay should increase exponentially."""
-    with patch("rpctl.api.retry.random.uniform", return_value=0):
-        d1 = _calculate_delay(1, base=1.0, max_delay=30.0)
-        d2 = _calculate_delay(2, base=1.0, max_delay=30.0)
-        d3 = _calculate_delay(3, base=1.0, max_delay=30.0)
+    d1 = _calculate_delay(1, base=1.0, max_delay=30.0, rng=_no_jitter)
+    d2 = _calculate_delay(2, base=1.0, max_delay=30.0, rng=_no_jitter)
+    d3 = _calculate_delay(3, base=1.0, max_delay=30.0, rng=_no_jitter)
     assert d1 == 1.0
     assert d2 == 2.0
     assert d3 == 4.0
@@ -200,16 +190,16 @@ def test_calculate_delay_exponential():
 
 def test_calculate_delay_capped():
     """Delay should not exceed max_delay."""
-    with patch("rpctl.api.retry.random.uniform", return_value=0):
-        d = _calculate_delay(10, base=1.0, max_delay=5.0)
+    d = _calculate_delay(10, base=1.0, max_delay=5.0, rng=_no_jitter)
     assert d == 5.0
 
 
 def test_calculate_delay_has_jitter():
     """Delay should include jitter (randomness)."""
+    rng = random.Random(42).uniform
     delays = set()
-    for _ in range(20):
-        d = _calculate_delay(1, base=1.0, max_delay=30.0)
+    for _ in range(5):
+        d = _calculate_delay(1, base=1.0, max_delay=30.0, rng=rng)
         delays.add(round(d, 4))
     # With jitter, we should see multiple distinct values
     assert len(delays) > 1
@@ -221,8 +211,7 @@ def test_calculate_delay_with_retry_after():
     assert d == 7.5
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_retry_429_then_500_then_success(mock_sleep):
+def test_retry_429_then_500_then_success(fake_sleep):
     """Mixed transient errors should all be retried."""
     call_count = 0
 
@@ -240,8 +229,7 @@ def test_retry_429_then_500_then_success(mock_sleep):
     assert call_count == 3
 
 
-@patch("rpctl.api.retry.time.sleep")
-def test_no_retry_on_none_status_code(mock_sleep):
+def test_no_retry_on_none_status_code(fake_sleep):
     """ApiError with no status code is not transient."""
 
     def graphql_error():
@@ -249,4 +237,4 @@ def test_no_retry_on_none_status_code(mock_sleep):
 
     with pytest.raises(ApiError, match="invalid query"):
         retry_on_transient(graphql_error)
-    mock_sleep.assert_not_called()
+    assert fake_sleep.sleeps == []
@@ -2,23 +2,37 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+
+import pytest
 
 from rpctl.cli.ssh import _build_ssh_command, _resolve_ssh_info
 from rpctl.errors import RpctlError
+from rpctl.main import app
 from rpctl.models.pod import Pod
+from tests.helpers.cli import runner
+
+
+@pytest.fixture(autouse=True)
+def no_execvp(monkeypatch):
+    """Record os.execvp calls so no test can replace the pytest process with ssh."""
+    calls = []
+    monkeypatch.setattr("rpctl.cli.ssh.os.execvp", lambda *a, **k: calls.append((a, k)))
+    return calls
+
+
+_DEFAULT_POD = Pod(
+    id="pod-abc123",
+    name="my-gpu-pod",
+    status="RUNNING",
+    gpu_type="A6000",
+    gpu_count=1,
+    image_name="nvidia/cuda",
+)
 
 
 def _make_pod(status="RUNNING", runtime=None) -> Pod:
-    return Pod(
-        id="pod-abc123",
-        name="my-gpu-pod",
-        status=status,
-        gpu_type="A6000",
-        gpu_count=1,
-        image_name="nvidia/cuda",
-        runtime=runtime or {},
-    )
+    return _DEFAULT_POD.model_copy(update={"status": status, "runtime": runtime or {}})
 
 
 # --- _resolve_ssh_info ---
@@ -49,8 +63,7 @@ def test_resolve_ssh_info_fallback_proxy():
 
 def test_resolve_ssh_info_no_runtime():
     """Falls back when runtime is None."""
-    pod = _make_pod()
-    pod.runtime = {}
+    pod = _make_pod(runtime=None)
     host, port = _resolve_ssh_info(pod)
     assert host == "pod-abc123-ssh.proxy.runpod.net"
     assert port == 22
@@ -87,52 +100,65 @@ def test_resolve_ssh_info_no_ip_in_port():
 # --- _build_ssh_command ---
 
 
-def test_build_ssh_command_basic():
-    cmd = _build_ssh_command("1.2.3.4", 22)
+@pytest.mark.parametrize(
+    ("kwargs", "expect_present", "expect_absent"),
+    [
+        pytest.param(
+            {},
+            {"ssh", "-p", "22", "root@1.2.3.4"},
+            {"-i"},
+            id="basic",
+        ),
+        pytest.param({"user": "ubuntu"}, {"ubuntu@1.2.3.4"}, {"root@1.2.3.4"}, id="custom-user"),
+        pytest.param(
+            {"key_file": "/home/user/.ssh/id_rsa"},
+            {"-i", "/home/user/.ssh/id_rsa"},
+            set(),
+            id="with-key",
+        ),
+        pytest.param(
+            {},
+            {"StrictHostKeyChecking=no", "UserKnownHostsFile=/dev/null"},
+            set(),
+            id="host-checking-disabled",
+        ),
+    ],
+)
+def test_build_ssh_command_tokens(kwargs, expect_present, expect_absent):
+    tokens = set(_build_ssh_command("1.2.3.4", 22, **kwargs))
+    assert expect_present <= tokens
+    assert expect_absent.isdisjoint(tokens)
+
+
+def test_build_ssh_command_ordering():
+    cmd = _build_ssh_command("1.2.3.4", 54321, remote_command="nvidia-smi")
     assert cmd[0] == "ssh"
-    assert "-p" in cmd
-    assert "22" in cmd
-    assert "root@1.2.3.4" in cmd
-
-
-def test_build_ssh_command_custom_user():
-    cmd = _build_ssh_command("1.2.3.4", 22, user="ubuntu")
-    assert "ubuntu@1.2.3.4" in cmd
-
-
-def test_build_ssh_command_custom_port():
-    cmd = _build_ssh_command("1.2.3.4", 54321)
-    idx = cmd.index("-p")
-    assert cmd[idx + 1] == "54321"
-
+    assert cmd[cmd.index("-p") + 1] == "54321"
+    assert cmd[-1] == "nvidia-smi"
 
-def test_build_ssh_command_with_key():
-    cmd = _build_ssh_command("1.2.3.4", 22, key_file="/home/user/.ssh/id_rsa")
-    assert "-i" in cmd
-    assert "/home/user/.ssh/id_rsa" in cmd
 
+# --- CLI integration ---
 
-def test_build_ssh_command_with_remote_command():
-    cmd = _build_ssh_command("1.2.3.4", 22, remote_command="nvidia-smi")
-    assert cmd[-1] == "nvidia-smi"
 
+@pytest.fixture
+def pod_service(monkeypatch):
+    """Install a get_pod-only service stub as ``rpctl.cli.ssh._get_pod_service``."""
 
-def test_build_ssh_command_strict_host_checking_disabled():
-    cmd = _build_ssh_command("1.2.3.4", 22)
-    assert "StrictHostKeyChecking=no" in cmd
-    assert "UserKnownHostsFile=/dev/null" in cmd
+    def _install(*, pod=None, error=None):
+        def get_pod(_pod_id):
+            if error is not None:
+                raise error
+            return pod
 
+        svc = SimpleNamespace(get_pod=get_pod)
+        monkeypatch.setattr("rpctl.cli.ssh._get_pod_service", lambda _ctx: svc)
+        return svc
 
-# --- CLI integration ---
+    return _install
 
 
-def test_ssh_connect_dry_run():
+def test_ssh_connect_dry_run(pod_service):
     """--dry-run prints the SSH command without executing."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     mock_pod = _make_pod(
         runtime={
             "ports": [
@@ -141,61 +167,36 @@ def test_ssh_connect_dry_run():
         },
     )
 
-    with patch("rpctl.cli.ssh._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.get_pod.return_value = mock_pod
-        mock_svc_fn.return_value = mock_svc
+    pod_service(pod=mock_pod)
 
-        result = runner.invoke(app, ["ssh", "connect", "pod-abc123", "--dry-run"])
-        assert result.exit_code == 0
-        assert "ssh" in result.output
-        assert "5.6.7.8" in result.output
-        assert "11111" in result.output
+    result = runner.invoke(app, ["ssh", "connect", "pod-abc123", "--dry-run"])
+    assert result.exit_code == 0
+    assert "ssh" in result.output
+    assert "5.6.7.8" in result.output
+    assert "11111" in result.output
 
 
-def test_ssh_connect_not_running():
+def test_ssh_connect_not_running(pod_service):
     """Error when pod is not running."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     mock_pod = _make_pod(status="EXITED")
 
-    with patch("rpctl.cli.ssh._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.get_pod.return_value = mock_pod
-        mock_svc_fn.return_value = mock_svc
+    pod_service(pod=mock_pod)
 
-        result = runner.invoke(app, ["ssh", "connect", "pod-abc123"])
-        assert result.exit_code == 1
-        assert "not running" in result.output
+    result = runner.invoke(app, ["ssh", "connect", "pod-abc123"])
+    assert result.exit_code == 1
+    assert "not running" in result.output
 
 
-def test_ssh_connect_api_error():
+def test_ssh_connect_api_error(pod_service):
     """Error when pod fetch fails."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
+    pod_service(error=RpctlError("Pod not found"))
 
-    with patch("rpctl.cli.ssh._get_pod_service") as mock_svc_fn:
-        mock_svc = MagicMock()
-        mock_svc.get_pod.side_effect = RpctlError("Pod not found")
-        mock_svc_fn.return_value = mock_svc
+    result = runner.invoke(app, ["ssh", "connect", "pod-xyz"])
+    assert result.exit_code == 1
 
-        result = runner.invoke(app, ["ssh", "connect", "pod-xyz"])
-        assert result.exit_code == 1
 
-
-def test_ssh_connect_execvp_called():
+def test_ssh_connect_execvp_called(pod_service, no_execvp):
     """Verify os.execvp is called with the right SSH command."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     mock_pod = _make_pod(
         runtime={
             "ports": [
@@ -204,57 +205,39 @@ def test_ssh_connect_execvp_called():
         },
     )
 
-    with (
-        patch("rpctl.cli.ssh._get_pod_service") as mock_svc_fn,
-        patch("rpctl.cli.ssh.os.execvp") as mock_exec,
-    ):
-        mock_svc = MagicMock()
-        mock_svc.get_pod.return_value = mock_pod
-        mock_svc_fn.return_value = mock_svc
+    pod_service(pod=mock_pod)
 
-        runner.invoke(app, ["ssh", "connect", "pod-abc123"])
-        mock_exec.assert_called_once()
-        args = mock_exec.call_args
-        assert args[0][0] == "ssh"
-        cmd_list = args[0][1]
-        assert "root@10.0.0.1" in cmd_list
-        assert "22222" in cmd_list
+    runner.invoke(app, ["ssh", "connect", "pod-abc123"])
+    assert len(no_execvp) == 1
+    (file, cmd_list), _ = no_execvp[-1]
+    assert file == "ssh"
+    assert "root@10.0.0.1" in cmd_list
+    assert "22222" in cmd_list
 
 
-def test_ssh_connect_with_options():
+def test_ssh_connect_with_options(pod_service, no_execvp):
     """Verify --user, --key, --command options are passed through."""
-    from typer.testing import CliRunner
-
-    from rpctl.main import app
-
-    runner = CliRunner()
     runtime = {"ports": [{"ip": "1.1.1.1", "privatePort": 22, "publicPort": 22}]}
     mock_pod = _make_pod(runtime=runtime)
 
-    with (
-        patch("rpctl.cli.ssh._get_pod_service") as mock_svc_fn,
-        patch("rpctl.cli.ssh.os.execvp") as mock_exec,
-    ):
-        mock_svc = MagicMock()
-        mock_svc.get_pod.return_value = mock_pod
-        mock_svc_fn.return_value = mock_svc
-
-        runner.invoke(
-            app,
-            [
-                "ssh",
-                "connect",
-                "pod-abc123",
-                "--user",
-                "ubuntu",
-                "--key",
-                "/tmp/key.pem",
-                "--command",
-                "nvidia-smi",
-            ],
-        )
-        mock_exec.assert_called_once()
-        cmd_list = mock_exec.call_args[0][1]
-        assert "ubuntu@1.1.1.1" in cmd_list
-        assert "/tmp/key.pem" in cmd_list
-        assert "nvidia-smi" in cmd_list
+    pod_service(pod=mock_pod)
+
+    runner.invoke(
+        app,
+        [
+            "ssh",
+            "connect",
+            "pod-abc123",
+            "--user",
+            "ubuntu",
+            "--key",
+            "/tmp/key.pem",
+            "--command",
+            "nvidia-smi",
+        ],
+    )
+    assert len(no_execvp) == 1
+    (_, cmd_list), _ = no_execvp[-1]
+    assert "ubuntu@1.1.1.1" in cmd_list
+    assert "/tmp/key.pem" in cmd_list
+    assert "nvidia-smi" in cmd_list
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
+import pytest
+import typer
 
+from rpctl.cli import user as user_cli
 from rpctl.errors import RpctlError
 from rpctl.main import app
 from rpctl.services.user_service import UserService
-
-runner = CliRunner()
-
+from tests.helpers.cli import runner
 
 # --- UserService unit tests ---
 
@@ -39,7 +40,7 @@ def test_user_service_set_ssh_key():
 # --- CLI: rpctl user info ---
 
 
-def test_cli_user_info():
+def test_cli_user_info(cli_ctx):
     """rpctl user info returns account data."""
     mock_data = {"id": "user-123", "pubKey": "ssh-ed25519 AAAA", "networkVolumes": []}
 
@@ -48,8 +49,7 @@ def test_cli_user_info():
         mock_svc.get_info.return_value = mock_data
         mock_svc_fn.return_value = mock_svc
 
-        result = runner.invoke(app, ["user", "info"])
-        assert result.exit_code == 0
+        user_cli.info(cli_ctx)
         mock_svc.get_info.assert_called_once()
 
 
@@ -67,59 +67,71 @@ def test_cli_user_info_json():
         assert "user-123" in result.output
 
 
-def test_cli_user_info_api_error():
+def test_cli_user_info_api_error(cli_ctx):
     """rpctl user info exits 1 on API error."""
     with patch("rpctl.cli.user._get_user_service") as mock_svc_fn:
         mock_svc = MagicMock()
         mock_svc.get_info.side_effect = RpctlError("API failure")
         mock_svc_fn.return_value = mock_svc
 
-        result = runner.invoke(app, ["user", "info"])
-        assert result.exit_code == 1
+        with pytest.raises(typer.Exit) as exc_info:
+            user_cli.info(cli_ctx)
+        assert exc_info.value.exit_code == 1
 
 
 # --- CLI: rpctl user set-ssh-key ---
 
 
-def test_cli_set_ssh_key_with_text():
+def test_cli_set_ssh_key_with_text(cli_ctx):
     """rpctl user set-ssh-key --text passes key text to service."""
     with patch("rpctl.cli.user._get_user_service") as mock_svc_fn:
         mock_svc = MagicMock()
         mock_svc.set_ssh_key.return_value = {}
         mock_svc_fn.return_value = mock_svc
 
-        result = runner.invoke(app, ["user", "set-ssh-key", "--text", "ssh-ed25519 AAAAtest"])
-        assert result.exit_code == 0
+        user_cli.set_ssh_key(cli_ctx, key_file=None, key_text="ssh-ed25519 AAAAtest")
         mock_svc.set_ssh_key.assert_called_once_with("ssh-ed25519 AAAAtest")
 
 
-def test_cli_set_ssh_key_with_file(tmp_path):
+def test_cli_set_ssh_key_with_file(monkeypatch):
     """rpctl user set-ssh-key --key reads key from file."""
-    key_file = tmp_path / "test.pub"
-    key_file.write_text("ssh-ed25519 AAAAfromfile\n")
+    opened = []
+    key = SimpleNamespace(exists=lambda: True, read_text=lambda: "ssh-ed25519 AAAAfromfile\n")
+
+    def fake_path(path):
+        opened.append(path)
+        return SimpleNamespace(expanduser=lambda: key)
+
+    monkeypatch.setattr("rpctl.cli.user.Path", fake_path)
 
     with patch("rpctl.cli.user._get_user_service") as mock_svc_fn:
         mock_svc = MagicMock()
         mock_svc.set_ssh_key.return_value = {}
         mock_svc_fn.return_value = mock_svc
 
-        result = runner.invoke(app, ["user", "set-ssh-key", "--key", str(key_file)])
+        result = runner.invoke(app, ["user", "set-ssh-key", "--key", "/tmp/key.pub"])
         assert result.exit_code == 0
+        assert opened == ["/tmp/key.pub"]
         mock_svc.set_ssh_key.assert_called_once_with("ssh-ed25519 AAAAfromfile")
 
 
-def test_cli_set_ssh_key_file_not_found():
+def test_cli_set_ssh_key_file_not_found(cli_ctx):
     """rpctl user set-ssh-key --key exits 1 for missing file."""
-    result = runner.invoke(app, ["user", "set-ssh-key", "--key", "/nonexistent/path/key.pub"])
-    assert result.exit_code == 1
+    with pytest.raises(typer.Exit) as exc_info:
+        user_cli.set_ssh_key(cli_ctx, key_file="/nonexistent/path/key.pub", key_text=None)
+    assert exc_info.value.exit_code == 1
 
 
-def test_cli_set_ssh_key_no_default():
-    """rpctl user set-ssh-key exits 1 when no key found and no args given."""
-    with patch("rpctl.cli.user.Path") as mock_path_cls:
-        mock_instance = MagicMock()
-        mock_instance.exists.return_value = False
-        mock_path_cls.return_value.expanduser.return_value = mock_instance
+@pytest.fixture
+def no_default_keys(monkeypatch):
+    """Make every default key path look missing, whatever is in the real ~/.ssh."""
+    missing = SimpleNamespace(exists=lambda: False, read_text=lambda: "")
+    monkeypatch.setattr(
+        "rpctl.cli.user.Path", lambda *_args: SimpleNamespace(expanduser=lambda: missing)
+    )
+
 
-        result = runner.invoke(app, ["user", "set-ssh-key"])
-        assert result.exit_code == 1
+def test_cli_set_ssh_key_no_default(no_default_keys):
+    """rpctl user set-ssh-key exits 1 when no key found and no args given."""
+    result = runner.invoke(app, ["user", "set-ssh-key"])
+    assert result.exit_code == 1